@@ -13,28 +13,30 @@ from app.core.config import load_config
 _bearer = HTTPBearer(auto_error=False)
 
 # ── Token cache ───────────────────────────────────────────────────────────
-# Avoids reading config.yaml on every single API request.
+# Avoids reading config.yaml on every single API request.  The token is
+# cached already UTF-8 encoded, ready for ``hmac.compare_digest``.
 
 _token_cache_lock = threading.Lock()
-_cached_token: str | None = None  # None = not yet loaded
+_cached_token: bytes | None = None  # None = not yet loaded
 _cache_initialized = False
 
 
-def _load_token_into_cache() -> str:
-    """Read token from config and cache it. Returns the token string."""
+def _load_token_into_cache() -> bytes:
+    """Read token from config and cache it. Returns the encoded token."""
     global _cached_token, _cache_initialized
     try:
         cfg = load_config()
         token = cfg.get("server", {}).get("token", "")
     except Exception:
         token = ""
-    _cached_token = token
+    token_bytes = str(token).encode("utf-8") if token else b""
+    _cached_token = token_bytes
     _cache_initialized = True
-    return token
+    return token_bytes
 
 
-def _get_cached_token() -> str:
-    """Return cached token, initializing on first access."""
+def _get_cached_token() -> bytes:
+    """Return cached encoded token, initializing on first access."""
     global _cache_initialized
     if _cache_initialized and _cached_token is not None:
         return _cached_token
@@ -77,7 +79,7 @@ async def verify_token(
 
     if credentials is None or not hmac.compare_digest(
         credentials.credentials.encode("utf-8"),
-        token.encode("utf-8"),
+        token,
     ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
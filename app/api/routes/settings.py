@@ -258,7 +258,7 @@ async def check_update(include_prerelease: bool = False):
 @router.get("/public-config", response_model=PublicConfigResponse)
 async def get_public_config():
     """获取 GitHub 远程公共配置（远程关闭或失败时默认不显示）。"""
-    result = await fetch_github_public_config(load_config())
+    result = await fetch_github_public_config()
     return PublicConfigResponse(
         success=result.success,
         visible=result.visible,
@@ -5,11 +5,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 import re
 import threading
-from typing import Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from app.core.config import load_config, get_provider_by_id
 
@@ -18,7 +20,13 @@ log = logging.getLogger(__name__)
 # ── Retry configuration ───────────────────────────────────────────────────────
 _RETRYABLE_STATUS_CODES = {429, 500, 502, 503}
 _MAX_RETRIES = 2
-_RETRY_BASE_DELAY = 1.0  # seconds, exponentially backed off
+_RETRY_BASE_DELAY = 1.0  # seconds, floor of the jittered backoff
+_RETRY_MAX_DELAY = 8.0  # seconds, cap of the jittered backoff
+
+# Accepted line types. Tuples rather than frozensets: the values checked come
+# from model JSON and may be unhashable (lists, dicts).
+_LINE_TYPES = ("me", "do", "b", "e")
+_SLASHED_LINE_TYPES = ("/me", "/do", "/b", "/e")
 
 
 # ── Default system prompt (fallback) ──────────────────────────────────────
@@ -175,6 +183,9 @@ def _build_client(
         if cached is not None:
             return cached
 
+    # Imported here: the openai SDK is heavy and most sessions never call AI.
+    from openai import AsyncOpenAI
+
     api_key = _sanitize_ascii(provider.get("api_key") or "unused")
     api_base = _sanitize_ascii(provider.get("api_base", ""))
 
@@ -460,7 +471,7 @@ async def rewrite_texts(
     for item in texts:
         item_type = item.get("type")
         item_content = item.get("content")
-        if item_type not in ("me", "do", "b", "e") or not isinstance(item_content, str):
+        if item_type not in _LINE_TYPES or not isinstance(item_content, str):
             raise ValueError("重写文本格式不正确。")
         content = item_content.strip()
         if not content:
@@ -506,7 +517,7 @@ async def rewrite_texts(
     rewritten: list[dict[str, str]] = []
     for idx, item in enumerate(parsed):
         expected_type = texts[idx].get("type")
-        safe_type = expected_type if expected_type in ("me", "do", "b", "e") else item["type"]
+        safe_type = expected_type if expected_type in _LINE_TYPES else item["type"]
         rewritten.append({"type": safe_type, "content": item["content"]})
     return rewritten, resolved_pid
 
@@ -521,16 +532,20 @@ async def _call_with_retry(
     """Call chat.completions.create with automatic retry on transient errors.
 
     Retries up to _MAX_RETRIES times on 429 / 5xx status codes using
-    exponential backoff (1s -> 2s).
+    decorrelated jitter (each delay drawn from [base, 3 * previous], capped),
+    so concurrent requests rejected together do not retry in lockstep.
     """
     last_exc: Exception | None = None
+    delay = _RETRY_BASE_DELAY
     for attempt in range(_MAX_RETRIES + 1):
         try:
             return await client.chat.completions.create(**kwargs)
         except Exception as exc:
             status = getattr(exc, "status_code", None)
             if status in _RETRYABLE_STATUS_CODES and attempt < _MAX_RETRIES:
-                delay = _RETRY_BASE_DELAY * (2 ** attempt)
+                delay = min(
+                    _RETRY_MAX_DELAY, random.uniform(_RETRY_BASE_DELAY, delay * 3)
+                )
                 log.warning(
                     "AI API returned %s, retrying in %.1fs (attempt %d/%d)",
                     status, delay, attempt + 1, _MAX_RETRIES,
@@ -585,9 +600,9 @@ def _try_parse_json_array(raw: str) -> list[dict[str, str]] | None:
         if not isinstance(content, str):
             return None
         # Normalise type — accept common variants
-        if item_type in ("me", "do", "b", "e"):
+        if item_type in _LINE_TYPES:
             pass
-        elif item_type in ("/me", "/do", "/b", "/e"):
+        elif item_type in _SLASHED_LINE_TYPES:
             item_type = item_type[1:]
         else:
             return None  # unexpected type -> abort JSON parse
@@ -678,7 +693,7 @@ def _parse_rewrite_payload(raw: str, expected_count: int) -> list[dict[str, str]
             raise RuntimeError("AI重写返回格式异常，数组元素必须是对象。")
         item_type = item.get("type")
         content = item.get("content")
-        if item_type not in ("me", "do", "b", "e") or not isinstance(content, str):
+        if item_type not in _LINE_TYPES or not isinstance(content, str):
             raise RuntimeError("AI重写返回格式异常，type/content字段不正确。")
         safe_content = content.strip()
         if not safe_content:
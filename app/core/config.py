@@ -25,34 +25,47 @@ PRESETS_DIR = DATA_DIR / "presets"
 
 _config_lock = threading.Lock()
 _cached_config: dict[str, Any] | None = None
-_cached_config_mtime: float = 0.0
+_cached_config_signature: tuple[int, int] | None = None
 
 
 def _ensure_dirs() -> None:
     PRESETS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def config_file_signature() -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` of the config file, or None if missing.
+
+    One ``stat`` call replaces the old ``exists`` + ``getmtime`` pair, and
+    the size catches rewrites within the filesystem's mtime granularity.
+    """
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def load_config() -> dict[str, Any]:
     """Load configuration from YAML file.
 
-    Uses file-mtime caching: returns an in-memory copy when the file
-    has not been modified since the last read, avoiding redundant disk IO.
+    Uses file-signature caching: returns an in-memory copy when the file's
+    mtime and size are unchanged since the last read, avoiding redundant
+    disk IO and YAML parsing.
     Thread-safe: all cache access is serialized via ``_config_lock``.
     """
-    global _cached_config, _cached_config_mtime
+    global _cached_config, _cached_config_signature
 
     _ensure_dirs()
-    if not CONFIG_PATH.exists():
+    current_signature = config_file_signature()
+    if current_signature is None:
         return _default_config()
 
     # Fast path: return cached copy when file hasn't changed
-    try:
-        current_mtime = os.path.getmtime(str(CONFIG_PATH))
-    except OSError:
-        current_mtime = 0.0
-
     with _config_lock:
-        if _cached_config is not None and current_mtime == _cached_config_mtime:
+        if (
+            _cached_config is not None
+            and current_signature == _cached_config_signature
+        ):
             return copy.deepcopy(_cached_config)
 
     try:
@@ -73,7 +86,7 @@ def load_config() -> dict[str, Any]:
     # Update cache
     with _config_lock:
         _cached_config = copy.deepcopy(result)
-        _cached_config_mtime = current_mtime
+        _cached_config_signature = current_signature
 
     return result
 
@@ -84,8 +97,6 @@ def save_config(cfg: dict[str, Any]) -> None:
     Thread-safe: writes are serialized via ``_config_lock``.
     Automatically refreshes the in-memory cache after a successful write.
     """
-    global _cached_config, _cached_config_mtime
-
     _ensure_dirs()
     with _config_lock:
         _save_config_locked(cfg)
@@ -93,7 +104,7 @@ def save_config(cfg: dict[str, Any]) -> None:
 
 def _save_config_locked(cfg: dict[str, Any]) -> None:
     """Internal save — caller MUST already hold ``_config_lock``."""
-    global _cached_config, _cached_config_mtime
+    global _cached_config, _cached_config_signature
 
     try:
         fd, tmp_path = tempfile.mkstemp(
@@ -120,12 +131,11 @@ def _save_config_locked(cfg: dict[str, Any]) -> None:
         return
 
     # Refresh cache with newly saved config
-    try:
-        _cached_config = copy.deepcopy(cfg)
-        _cached_config_mtime = os.path.getmtime(str(CONFIG_PATH))
-    except OSError:
+    _cached_config_signature = config_file_signature()
+    if _cached_config_signature is None:
         _cached_config = None
-        _cached_config_mtime = 0.0
+    else:
+        _cached_config = copy.deepcopy(cfg)
 
 
 def update_config(patch: dict[str, Any]) -> dict[str, Any]:
@@ -144,17 +154,13 @@ def update_config(patch: dict[str, Any]) -> dict[str, Any]:
 
 def _load_config_locked() -> dict[str, Any]:
     """Internal config load — caller MUST already hold ``_config_lock``."""
-    global _cached_config, _cached_config_mtime
+    global _cached_config, _cached_config_signature
 
-    if not CONFIG_PATH.exists():
+    current_signature = config_file_signature()
+    if current_signature is None:
         return _default_config()
 
-    try:
-        current_mtime = os.path.getmtime(str(CONFIG_PATH))
-    except OSError:
-        current_mtime = 0.0
-
-    if _cached_config is not None and current_mtime == _cached_config_mtime:
+    if _cached_config is not None and current_signature == _cached_config_signature:
         return copy.deepcopy(_cached_config)
 
     try:
@@ -172,7 +178,7 @@ def _load_config_locked() -> dict[str, Any]:
 
     result = _merge_defaults(cfg)
     _cached_config = copy.deepcopy(result)
-    _cached_config_mtime = current_mtime
+    _cached_config_signature = current_signature
     return result
 
 
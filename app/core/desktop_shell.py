@@ -10,7 +10,11 @@ import threading
 from collections.abc import Callable
 from typing import Any, Literal
 
-from app.core.config import load_config, resolve_enable_tray_on_start
+from app.core.config import (
+    config_file_signature,
+    load_config,
+    resolve_enable_tray_on_start,
+)
 
 _CLOSE_ACTION_ASK = "ask"
 _CLOSE_ACTION_MINIMIZE_TO_TRAY = "minimize_to_tray"
@@ -31,6 +35,8 @@ _window_maximized = False
 _exit_requested = False
 _tray_controller: _TrayController | None = None
 _tray_title = "VanceSender"
+# (config_file_signature(), close action) from the last config read.
+_close_action_cache: tuple[tuple[int, int] | None, str] | None = None
 
 try:
     if sys.platform == "win32":
@@ -40,6 +46,13 @@ try:
 except OSError:
     _user32 = None  # type: ignore[assignment]
 
+# Optional dependency availability is fixed for the process lifetime.
+_HAS_WEBVIEW = importlib.util.find_spec("webview") is not None
+_HAS_SYSTEM_TRAY = all(
+    importlib.util.find_spec(module_name) is not None
+    for module_name in ("pystray", "PIL")
+)
+
 
 class _TrayController:
     """Manage system tray icon lifecycle and click actions."""
@@ -340,15 +353,12 @@ def _get_tray_title() -> str:
 
 def has_webview_support() -> bool:
     """Return whether pywebview is available in current runtime."""
-    return importlib.util.find_spec("webview") is not None
+    return _HAS_WEBVIEW
 
 
 def has_system_tray_support() -> bool:
     """Return whether runtime has required tray dependencies."""
-    return (
-        importlib.util.find_spec("pystray") is not None
-        and importlib.util.find_spec("PIL") is not None
-    )
+    return _HAS_SYSTEM_TRAY
 
 
 def normalize_close_action(value: object) -> str:
@@ -401,21 +411,24 @@ def _create_tray_icon_image() -> object | None:
 
 def _show_desktop_window() -> bool:
     """Show previously hidden desktop window from tray."""
-    window = _get_desktop_window()
+    window: Any = _get_desktop_window()
     if window is None:
         return False
 
+    # show() only un-hides; restore() is still needed to bring a window that
+    # was minimized before being hidden back to its normal state.
     shown = False
-    for method_name in ("show", "restore"):
-        method = getattr(window, method_name, None)
-        if not callable(method):
-            continue
+    try:
+        window.show()
+        shown = True
+    except Exception:
+        pass
 
-        try:
-            method()
-        except Exception:
-            continue
+    try:
+        window.restore()
         shown = True
+    except Exception:
+        pass
 
     if shown:
         _set_window_maximized(False)
@@ -424,27 +437,24 @@ def _show_desktop_window() -> bool:
 
 def _hide_desktop_window_to_tray() -> bool:
     """Hide desktop window so app keeps running in system tray."""
-    window = _get_desktop_window()
+    window: Any = _get_desktop_window()
     if window is None:
         return False
 
     if not _ensure_tray_controller_started():
         return False
 
-    for method_name in ("hide", "minimize"):
-        method = getattr(window, method_name, None)
-        if not callable(method):
-            continue
-
+    # Fall back to minimize only when hide() is unavailable or fails.
+    try:
+        window.hide()
+    except Exception:
         try:
-            method()
+            window.minimize()
         except Exception:
-            continue
-
-        _set_window_maximized(False)
-        return True
+            return False
 
-    return False
+    _set_window_maximized(False)
+    return True
 
 
 def _close_desktop_window(force_exit: bool = True) -> bool:
@@ -510,15 +520,38 @@ def _resolve_launch_tray_preferences(
     launch_options: dict[str, object] | None,
 ) -> tuple[bool, str]:
     """Resolve startup tray and close policy values from launch config."""
+    # Read before the config so an edit racing the read forces a re-read.
+    signature = config_file_signature() if launch_options is None else None
     launch_cfg = _launch_config_from_input(launch_options)
 
     enable_tray_on_start = resolve_enable_tray_on_start(launch_cfg)
     close_action = normalize_close_action(
         launch_cfg.get("close_action", _CLOSE_ACTION_ASK)
     )
+    if launch_options is None:
+        _set_cached_close_action(signature, close_action)
     return enable_tray_on_start, close_action
 
 
+def _set_cached_close_action(
+    signature: tuple[int, int] | None, close_action: str
+) -> None:
+    """Store effective close action resolved from persisted config."""
+    global _close_action_cache
+    with _window_lock:
+        _close_action_cache = (signature, close_action)
+
+
+def _get_cached_close_action() -> str | None:
+    """Return cached close action, or None when config.yaml has changed."""
+    signature = config_file_signature()
+    with _window_lock:
+        cached = _close_action_cache
+    if cached is None or cached[0] != signature:
+        return None
+    return cached[1]
+
+
 def _ask_close_action_and_maybe_remember(window: object) -> str:
     """Ask user close behavior once (no remembered choice here)."""
     confirm_method = getattr(window, "create_confirmation_dialog", None)
@@ -544,7 +577,9 @@ def _ask_close_action_and_maybe_remember(window: object) -> str:
 
 def _resolve_requested_close_action() -> str:
     """Resolve effective close action (ask/minimize/exit)."""
-    _, close_action = _resolve_launch_tray_preferences(None)
+    close_action = _get_cached_close_action()
+    if close_action is None:
+        _, close_action = _resolve_launch_tray_preferences(None)
     if close_action != _CLOSE_ACTION_ASK:
         return close_action
 
@@ -640,40 +675,12 @@ def _ensure_tray_controller_started() -> bool:
     return _start_tray_controller(title=_get_tray_title())
 
 
-def perform_window_action(
-    action: Literal[
-        "minimize",
-        "maximize",
-        "restore",
-        "close",
-        "request_close",
-        "hide_to_tray",
-        "show",
-        "exit",
-    ],
-) -> bool:
-    """Perform a window action for currently active desktop shell window."""
-    if action == "request_close":
-        return request_desktop_window_close()
-    if action == "hide_to_tray":
-        return _hide_desktop_window_to_tray()
-    if action == "show":
-        return _show_desktop_window()
-    if action in {"close", "exit"}:
-        return _close_desktop_window(force_exit=True)
-
+def _call_window_state_method(method_name: str, maximized: bool) -> bool:
+    """Call minimize/maximize/restore and sync cached maximize state."""
     window = _get_desktop_window()
     if window is None:
         return False
 
-    method_name = {
-        "minimize": "minimize",
-        "maximize": "maximize",
-        "restore": "restore",
-    }.get(action)
-    if method_name is None:
-        return False
-
     method = getattr(window, method_name, None)
     if not callable(method):
         return False
@@ -683,14 +690,41 @@ def perform_window_action(
     except Exception:
         return False
 
-    if action == "maximize":
-        _set_window_maximized(True)
-    elif action in {"restore", "minimize"}:
-        _set_window_maximized(False)
-
+    _set_window_maximized(maximized)
     return True
 
 
+_WINDOW_ACTION_DISPATCH: dict[str, Callable[[], bool]] = {
+    "minimize": lambda: _call_window_state_method("minimize", False),
+    "maximize": lambda: _call_window_state_method("maximize", True),
+    "restore": lambda: _call_window_state_method("restore", False),
+    "close": lambda: _close_desktop_window(force_exit=True),
+    "exit": lambda: _close_desktop_window(force_exit=True),
+    "request_close": request_desktop_window_close,
+    "hide_to_tray": _hide_desktop_window_to_tray,
+    "show": _show_desktop_window,
+}
+
+
+def perform_window_action(
+    action: Literal[
+        "minimize",
+        "maximize",
+        "restore",
+        "close",
+        "request_close",
+        "hide_to_tray",
+        "show",
+        "exit",
+    ],
+) -> bool:
+    """Perform a window action for currently active desktop shell window."""
+    handler = _WINDOW_ACTION_DISPATCH.get(action)
+    if handler is None:
+        return False
+    return handler()
+
+
 def get_desktop_window_state() -> dict[str, bool]:
     """Return active/maximized state for custom window titlebar UI."""
     return {
@@ -2,24 +2,42 @@
 
 from __future__ import annotations
 
-import ipaddress
+import functools
 import socket
 
 
 def _is_usable_ipv4(value: str) -> bool:
     """Return True when value looks like a usable non-loopback IPv4."""
-    try:
-        ip = ipaddress.ip_address(value)
-    except ValueError:
+    octets = value.split(".")
+    if len(octets) != 4:
+        return False
+
+    parsed: list[int] = []
+    for octet in octets:
+        # Match ipaddress strictness: plain decimal, no signs/spaces/leading zeros.
+        if not octet.isdigit() or not octet.isascii() or len(octet) > 3:
+            return False
+        if len(octet) > 1 and octet[0] == "0":
+            return False
+        number = int(octet)
+        if number > 255:
+            return False
+        parsed.append(number)
+
+    first, second = parsed[0], parsed[1]
+    if first == 127:  # loopback
         return False
+    if 224 <= first <= 239:  # multicast
+        return False
+    if first == 169 and second == 254:  # link-local
+        return False
+    return parsed != [0, 0, 0, 0]  # unspecified
+
 
-    return (
-        ip.version == 4
-        and not ip.is_loopback
-        and not ip.is_unspecified
-        and not ip.is_multicast
-        and not ip.is_link_local
-    )
+@functools.lru_cache(maxsize=1)
+def _local_hostname() -> str:
+    """Return this machine's hostname; it is fixed for the process lifetime."""
+    return socket.gethostname()
 
 
 def _append_ipv4_candidate(candidates: list[str], value: str) -> None:
@@ -43,7 +61,7 @@ def get_lan_ipv4_addresses() -> list[str]:
         pass
 
     try:
-        _hostname, _aliases, addresses = socket.gethostbyname_ex(socket.gethostname())
+        _hostname, _aliases, addresses = socket.gethostbyname_ex(_local_hostname())
         for candidate in addresses:
             _append_ipv4_candidate(candidates, candidate)
     except OSError:
@@ -70,15 +70,22 @@ def get_notifications(*, clear: bool = False) -> list[dict[str, Any]]:
 
     When *clear* is True the store is emptied after reading.
     """
+    # The WebUI polls this and the store is usually empty; reading a list's
+    # length is atomic, so skip the lock when there is nothing to return.
+    if not _store:
+        return []
+
+    # Entries are never mutated after creation, so copying the list under the
+    # lock is enough; the dicts are built after push_notification can resume.
     with _lock:
-        items = [
-            {
-                "level": n.level,
-                "message": n.message,
-                "timestamp": n.timestamp,
-            }
-            for n in _store
-        ]
+        snapshot = tuple(_store)
         if clear:
             _store.clear()
-    return items
+    return [
+        {
+            "level": n.level,
+            "message": n.message,
+            "timestamp": n.timestamp,
+        }
+        for n in snapshot
+    ]
@@ -24,8 +24,9 @@ def register_overlay_status_handler(handler: OverlayStatusHandler | None) -> Non
 
 def push_overlay_status(text: str, final: bool) -> None:
     """Push one status message to overlay when handler is available."""
-    with _handler_lock:
-        handler = _status_handler
+    # Registration swaps the whole reference and a module-global read is
+    # atomic, so the hot path reads it without taking _handler_lock.
+    handler = _status_handler
 
     if handler is None:
         return
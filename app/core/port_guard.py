@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 import csv
+import ctypes
+import ctypes.wintypes as wintypes
 import errno
+import ipaddress
 import os
+import re
 import socket
 import subprocess
 import sys
 import time
 from dataclasses import dataclass
+from typing import Any
 
 from app.core.notifications import push_notification
 
 
-_WINDOWS_LISTEN_STATES = {"LISTENING", "侦听"}
+# "  TCP    0.0.0.0:8730    0.0.0.0:0    LISTENING    1234" (zh-CN: 侦听)
+_NETSTAT_LISTEN_PATTERN = re.compile(
+    r"^\s*TCP\s+(\S+:(\d+))\s+\S+\s+(?:LISTENING|侦听)\s+(\d+)\s*$",
+    re.MULTILINE | re.IGNORECASE,
+)
 _DIALOG_TITLE = "VanceSender"
 _WINDOWS_MESSAGE_BOX_OK = 0x00000000
 _WINDOWS_MESSAGE_BOX_YESNO = 0x00000004
@@ -23,6 +32,120 @@ _WINDOWS_MESSAGE_BOX_ICON_WARNING = 0x00000030
 _WINDOWS_MESSAGE_BOX_ICON_INFORMATION = 0x00000040
 _WINDOWS_MESSAGE_BOX_TOPMOST = 0x00040000
 _WINDOWS_DIALOG_RESULT_YES = 6
+_WINDOWS_AF_INET = 2
+_WINDOWS_AF_INET6 = 23
+_WINDOWS_TCP_TABLE_OWNER_PID_LISTENER = 3
+_WINDOWS_MIB_TCP_STATE_LISTEN = 2
+_WINDOWS_NO_ERROR = 0
+_WINDOWS_ERROR_INSUFFICIENT_BUFFER = 122
+_WINDOWS_ERROR_ACCESS_DENIED = 5
+_WINDOWS_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_WINDOWS_SYNCHRONIZE = 0x00100000
+_WINDOWS_PROCESS_TERMINATE = 0x0001
+_WINDOWS_TH32CS_SNAPPROCESS = 0x00000002
+_WINDOWS_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+_WINDOWS_WAIT_OBJECT_0 = 0x00000000
+_EADDRINUSE_CODES = frozenset(
+    code for code in (getattr(errno, "EADDRINUSE", None), 10048) if code is not None
+)
+_SOCKADDR_CACHE_TTL_SECONDS = 10.0
+_TCP_STREAM = int(socket.SOCK_STREAM)
+_TCP_PROTO = int(socket.IPPROTO_TCP)
+# Windows defines SO_EXCLUSIVEADDRUSE as ~SO_REUSEADDR; setsockopt takes it as
+# the signed int (-5), so the fallback must not be masked to unsigned.
+_SO_EXCLUSIVEADDRUSE = getattr(socket, "SO_EXCLUSIVEADDRUSE", ~socket.SO_REUSEADDR)
+
+try:
+    if sys.platform == "win32":
+        _iphlpapi = ctypes.WinDLL("iphlpapi", use_last_error=True)
+        _iphlpapi.GetExtendedTcpTable.argtypes = (
+            ctypes.c_void_p,
+            ctypes.POINTER(wintypes.DWORD),
+            wintypes.BOOL,
+            wintypes.ULONG,
+            ctypes.c_int,
+            wintypes.ULONG,
+        )
+        _iphlpapi.GetExtendedTcpTable.restype = wintypes.DWORD
+    else:
+        _iphlpapi = None  # type: ignore[assignment]
+except (OSError, AttributeError):
+    _iphlpapi = None  # type: ignore[assignment]
+
+
+class _MIB_TCPROW_OWNER_PID(ctypes.Structure):
+    _fields_ = [
+        ("dwState", wintypes.DWORD),
+        ("dwLocalAddr", wintypes.DWORD),
+        ("dwLocalPort", wintypes.DWORD),
+        ("dwRemoteAddr", wintypes.DWORD),
+        ("dwRemotePort", wintypes.DWORD),
+        ("dwOwningPid", wintypes.DWORD),
+    ]
+
+
+class _MIB_TCP6ROW_OWNER_PID(ctypes.Structure):
+    _fields_ = [
+        ("ucLocalAddr", ctypes.c_ubyte * 16),
+        ("dwLocalScopeId", wintypes.DWORD),
+        ("dwLocalPort", wintypes.DWORD),
+        ("ucRemoteAddr", ctypes.c_ubyte * 16),
+        ("dwRemoteScopeId", wintypes.DWORD),
+        ("dwRemotePort", wintypes.DWORD),
+        ("dwState", wintypes.DWORD),
+        ("dwOwningPid", wintypes.DWORD),
+    ]
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * 260),
+    ]
+
+
+try:
+    if sys.platform == "win32":
+        _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+        _kernel32.OpenProcess.restype = wintypes.HANDLE
+        _kernel32.QueryFullProcessImageNameW.argtypes = (
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.LPWSTR,
+            ctypes.POINTER(wintypes.DWORD),
+        )
+        _kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+        _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        _kernel32.CloseHandle.restype = wintypes.BOOL
+        _kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+        _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        _kernel32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+        _kernel32.TerminateProcess.restype = wintypes.BOOL
+        _kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+        _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        _kernel32.Process32FirstW.argtypes = (
+            wintypes.HANDLE,
+            ctypes.POINTER(_PROCESSENTRY32W),
+        )
+        _kernel32.Process32FirstW.restype = wintypes.BOOL
+        _kernel32.Process32NextW.argtypes = (
+            wintypes.HANDLE,
+            ctypes.POINTER(_PROCESSENTRY32W),
+        )
+        _kernel32.Process32NextW.restype = wintypes.BOOL
+    else:
+        _kernel32 = None  # type: ignore[assignment]
+except (OSError, AttributeError):
+    _kernel32 = None  # type: ignore[assignment]
 
 
 @dataclass(frozen=True)
@@ -34,8 +157,45 @@ class PortOccupier:
     local_address: str | None
 
 
-def _is_port_bindable(host: str, port: int) -> bool:
-    """Return True if the target host:port can be bound right now."""
+# port -> [(pid, local_address)] for every TCP listener in one table read.
+_ListenerSnapshot = dict[int, list[tuple[int, str]]]
+# (family, socktype, proto, sockaddr) bind targets resolved for host:port.
+_ResolvedSockaddrs = tuple[tuple[int, int, int, tuple[Any, ...]], ...]
+
+_SOCKADDR_CACHE: dict[tuple[str, int], tuple[float, _ResolvedSockaddrs | None]] = {}
+
+
+def _literal_sockaddr(host: str, port: int) -> _ResolvedSockaddrs | None:
+    """Build bind target for literal IP hosts without calling getaddrinfo."""
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return None
+
+    if ip.version == 4:
+        return ((socket.AF_INET, _TCP_STREAM, _TCP_PROTO, (host, port)),)
+    if "%" in host:
+        # Scoped IPv6 literals need the resolver to map the zone to a scope id.
+        return None
+    return ((socket.AF_INET6, _TCP_STREAM, _TCP_PROTO, (host, port, 0, 0)),)
+
+
+def _resolve_sockaddrs(host: str, port: int) -> _ResolvedSockaddrs | None:
+    """Resolve unique TCP bind targets for host:port; None if host is unresolvable.
+
+    Results are cached briefly so retry loops do not hit the resolver on every
+    tick, while interface changes are still picked up after the TTL.
+    """
+    literal = _literal_sockaddr(host, port)
+    if literal is not None:
+        return literal
+
+    cache_key = (host, port)
+    now = time.monotonic()
+    cached = _SOCKADDR_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     try:
         addr_info_list = socket.getaddrinfo(
             host,
@@ -45,27 +205,52 @@ def _is_port_bindable(host: str, port: int) -> bool:
             proto=socket.IPPROTO_TCP,
         )
     except socket.gaierror:
-        # Host parse issue should be handled by uvicorn startup path.
-        return True
-
-    checked_sockaddrs: set[tuple[int, tuple[object, ...]]] = set()
-    eaddrinuse = {getattr(errno, "EADDRINUSE", None), 10048}
-
-    for family, socktype, proto, _canonname, sockaddr in addr_info_list:
-        if not isinstance(sockaddr, tuple):
-            continue
+        resolved = None
+    else:
+        # getaddrinfo yields only a handful of entries; a list scan beats hashing.
+        checked_sockaddrs: list[tuple[int, tuple[Any, ...]]] = []
+        unique: list[tuple[int, int, int, tuple[Any, ...]]] = []
+        for family, socktype, proto, _canonname, sockaddr in addr_info_list:
+            if not isinstance(sockaddr, tuple):
+                continue
+
+            sockaddr_key = (family, sockaddr)
+            if sockaddr_key in checked_sockaddrs:
+                continue
+            checked_sockaddrs.append(sockaddr_key)
+            unique.append((family, socktype, proto, sockaddr))
+        resolved = tuple(unique)
+
+    _SOCKADDR_CACHE[cache_key] = (now + _SOCKADDR_CACHE_TTL_SECONDS, resolved)
+    return resolved
+
+
+def _set_exclusive_bind(sock: socket.socket) -> None:
+    """Make probe bind fail when any other socket already owns the port.
+
+    Without SO_EXCLUSIVEADDRUSE, Windows may let the probe bind alongside an
+    existing listener and report the port as free.
+    """
+    try:
+        if sys.platform == "win32":
+            sock.setsockopt(socket.SOL_SOCKET, _SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 0)
+    except OSError:
+        pass
 
-        sockaddr_key = (family, tuple(sockaddr))
-        if sockaddr_key in checked_sockaddrs:
-            continue
-        checked_sockaddrs.add(sockaddr_key)
 
+def _try_bind(resolved: _ResolvedSockaddrs) -> bool:
+    """Probe resolved addresses; False as soon as one reports address-in-use."""
+    for family, socktype, proto, sockaddr in resolved:
         sock = socket.socket(family, socktype, proto)
         try:
+            _set_exclusive_bind(sock)
             sock.bind(sockaddr)
             return True
         except OSError as exc:
-            if exc.errno in eaddrinuse or getattr(exc, "winerror", None) in eaddrinuse:
+            winerror = getattr(exc, "winerror", None)
+            if exc.errno in _EADDRINUSE_CODES or winerror in _EADDRINUSE_CODES:
                 return False
             continue
         finally:
@@ -74,20 +259,13 @@ def _is_port_bindable(host: str, port: int) -> bool:
     return True
 
 
-def _extract_port_from_local_address(local_address: str) -> int | None:
-    """Extract TCP port from netstat local address column."""
-    parts = local_address.rsplit(":", 1)
-    if len(parts) != 2:
-        return None
-
-    port_text = parts[1].strip()
-    if not port_text.isdigit():
-        return None
-
-    try:
-        return int(port_text)
-    except ValueError:
-        return None
+def _is_port_bindable(host: str, port: int) -> bool:
+    """Return True if the target host:port can be bound right now."""
+    resolved = _resolve_sockaddrs(host, port)
+    if resolved is None:
+        # Host parse issue should be handled by uvicorn startup path.
+        return True
+    return _try_bind(resolved)
 
 
 def _run_command(command: list[str]) -> subprocess.CompletedProcess[str]:
@@ -152,57 +330,162 @@ def _notify_user(
         _show_notification_dialog(message, level=level)
 
 
-def _list_listening_entries_for_port(port: int) -> list[tuple[int, str]]:
-    """Return (pid, local_address) entries that are listening on target port."""
-    if sys.platform != "win32":
-        return []
+def _read_extended_tcp_table(family: int) -> ctypes.Array[ctypes.c_char] | None:
+    """Fetch raw TCP listener table with owning pids for one address family."""
+    iphlpapi = _iphlpapi
+    if iphlpapi is None:
+        return None
 
-    result = _run_command(["netstat", "-ano", "-p", "tcp"])
-    if result.returncode != 0:
+    size = wintypes.DWORD(0)
+    buffer: ctypes.Array[ctypes.c_char] | None = None
+
+    # The table may grow between the sizing call and the fetch; retry a few times.
+    for _attempt in range(4):
+        status = iphlpapi.GetExtendedTcpTable(
+            buffer,
+            ctypes.byref(size),
+            False,
+            family,
+            _WINDOWS_TCP_TABLE_OWNER_PID_LISTENER,
+            0,
+        )
+        if status == _WINDOWS_NO_ERROR and buffer is not None:
+            return buffer
+        if status != _WINDOWS_ERROR_INSUFFICIENT_BUFFER:
+            return None
+        buffer = ctypes.create_string_buffer(size.value)
+
+    return None
+
+
+def _read_tcp_table_rows(
+    family: int, row_type: type[ctypes.Structure]
+) -> list[Any] | None:
+    """Return typed listener rows for one address family, or None on failure."""
+    buffer = _read_extended_tcp_table(family)
+    if buffer is None:
+        return None
+
+    entry_count = wintypes.DWORD.from_buffer(buffer).value
+    rows_offset = ctypes.alignment(row_type)
+    if entry_count <= 0:
         return []
+    return list((row_type * entry_count).from_buffer(buffer, rows_offset))
 
-    entries: list[tuple[int, str]] = []
-    seen: set[tuple[int, str]] = set()
 
-    for line in result.stdout.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
+def _add_snapshot_entry(
+    snapshot: _ListenerSnapshot, port: int, pid: int, local_address: str
+) -> None:
+    """Append a (pid, local_address) listener under port, skipping duplicates."""
+    entries = snapshot.setdefault(port, [])
+    entry = (pid, local_address)
+    if entry not in entries:
+        entries.append(entry)
 
-        parts = stripped.split()
-        if len(parts) < 4:
-            continue
 
-        protocol = parts[0].upper()
-        if protocol != "TCP":
-            continue
+def _snapshot_listeners_via_iphlpapi() -> _ListenerSnapshot | None:
+    """Read all listeners from GetExtendedTcpTable; None when the API is unavailable."""
+    if _iphlpapi is None:
+        return None
 
-        local_address = parts[1]
-        if _extract_port_from_local_address(local_address) != port:
-            continue
+    ipv4_rows = _read_tcp_table_rows(_WINDOWS_AF_INET, _MIB_TCPROW_OWNER_PID)
+    if ipv4_rows is None:
+        return None
+    ipv6_rows = _read_tcp_table_rows(_WINDOWS_AF_INET6, _MIB_TCP6ROW_OWNER_PID) or []
 
-        pid_text = parts[-1]
-        if not pid_text.isdigit():
-            continue
+    snapshot: _ListenerSnapshot = {}
 
-        state_text = parts[-2].upper() if len(parts) >= 5 else ""
-        if state_text not in _WINDOWS_LISTEN_STATES:
+    for row in ipv4_rows:
+        if row.dwState != _WINDOWS_MIB_TCP_STATE_LISTEN:
             continue
+        port = socket.ntohs(row.dwLocalPort & 0xFFFF)
+        host = socket.inet_ntoa(int(row.dwLocalAddr).to_bytes(4, "little"))
+        _add_snapshot_entry(snapshot, port, int(row.dwOwningPid), f"{host}:{port}")
 
-        entry = (int(pid_text), local_address)
-        if entry in seen:
+    for row in ipv6_rows:
+        if row.dwState != _WINDOWS_MIB_TCP_STATE_LISTEN:
             continue
-        seen.add(entry)
-        entries.append(entry)
+        port = socket.ntohs(row.dwLocalPort & 0xFFFF)
+        host = socket.inet_ntop(socket.AF_INET6, bytes(row.ucLocalAddr))
+        _add_snapshot_entry(snapshot, port, int(row.dwOwningPid), f"[{host}]:{port}")
+
+    return snapshot
+
+
+def _snapshot_listeners_via_netstat() -> _ListenerSnapshot:
+    """Fallback listener discovery by parsing `netstat -ano` text output."""
+    result = _run_command(["netstat", "-ano", "-p", "tcp"])
+    if result.returncode != 0:
+        return {}
+
+    snapshot: _ListenerSnapshot = {}
+    for match in _NETSTAT_LISTEN_PATTERN.finditer(result.stdout):
+        local_address, port_text, pid_text = match.group(1, 2, 3)
+        _add_snapshot_entry(snapshot, int(port_text), int(pid_text), local_address)
+
+    return snapshot
+
+
+def _snapshot_tcp_listeners() -> _ListenerSnapshot:
+    """Capture one port -> [(pid, local_address)] view of all TCP listeners."""
+    if sys.platform != "win32":
+        return {}
+
+    # An empty table is as suspect as a failed call (a listener always exists
+    # while the caller is asking), so netstat gets a chance in both cases.
+    snapshot = _snapshot_listeners_via_iphlpapi()
+    if snapshot:
+        return snapshot
+    return _snapshot_listeners_via_netstat()
+
+
+def _list_listening_entries_for_port(
+    port: int, snapshot: _ListenerSnapshot | None = None
+) -> list[tuple[int, str]]:
+    """Return (pid, local_address) entries that are listening on target port."""
+    if snapshot is None:
+        snapshot = _snapshot_tcp_listeners()
+    return list(snapshot.get(port, []))
+
+
+def _lookup_process_name_via_handle(pid: int) -> tuple[bool, str | None]:
+    """Query process image name directly; returns (handled, process_name).
+
+    ``handled`` is False when kernel32 is unavailable, when opening the
+    process is denied, or when QueryFullProcessImageNameW fails, so the
+    caller can retry through tasklist (e.g. for protected processes).
+    """
+    if _kernel32 is None:
+        return False, None
+
+    ctypes.set_last_error(0)
+    handle = _kernel32.OpenProcess(_WINDOWS_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        if ctypes.get_last_error() == _WINDOWS_ERROR_ACCESS_DENIED:
+            return False, None
+        return True, None
 
-    return entries
+    try:
+        buffer = ctypes.create_unicode_buffer(32768)
+        size = wintypes.DWORD(len(buffer))
+        if not _kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return False, None
+    finally:
+        _kernel32.CloseHandle(handle)
+
+    process_name = os.path.basename(buffer.value)
+    return True, process_name or None
 
 
 def _lookup_process_name(pid: int) -> str | None:
-    """Get process name for pid via tasklist on Windows."""
+    """Get process name for pid, falling back to tasklist on Windows."""
     if sys.platform != "win32":
         return None
 
+    handled, process_name = _lookup_process_name_via_handle(pid)
+    if handled:
+        return process_name
+
     result = _run_command(["tasklist", "/FI", f"PID eq {pid}", "/FO", "CSV", "/NH"])
     if result.returncode != 0:
         return None
@@ -229,9 +512,11 @@ def _lookup_process_name(pid: int) -> str | None:
     return process_name or None
 
 
-def _find_port_occupier(port: int) -> PortOccupier | None:
+def _find_port_occupier(
+    port: int, snapshot: _ListenerSnapshot | None = None
+) -> PortOccupier | None:
     """Discover the first listening process occupying target port."""
-    for pid, local_address in _list_listening_entries_for_port(port):
+    for pid, local_address in _list_listening_entries_for_port(port, snapshot):
         if pid == os.getpid():
             continue
         return PortOccupier(
@@ -242,9 +527,11 @@ def _find_port_occupier(port: int) -> PortOccupier | None:
     return None
 
 
-def _occupier_still_owns_port(occupier: PortOccupier, port: int) -> bool:
+def _occupier_still_owns_port(
+    occupier: PortOccupier, port: int, snapshot: _ListenerSnapshot | None = None
+) -> bool:
     """Re-check that pid still appears as listener for target port."""
-    for pid, _local_address in _list_listening_entries_for_port(port):
+    for pid, _local_address in _list_listening_entries_for_port(port, snapshot):
         if pid == occupier.pid:
             return True
     return False
@@ -285,11 +572,67 @@ def _prompt_yes_no(question: str) -> bool:
         print("请输入 y 或 n。")
 
 
-def _force_kill_pid(pid: int) -> tuple[bool, str | None]:
-    """Force terminate a Windows process tree by pid."""
-    if sys.platform != "win32":
-        return False, "当前平台暂不支持自动强制关闭占用进程"
+def _list_descendant_pids(pid: int) -> list[int]:
+    """Return descendants of pid (deepest first) from one toolhelp snapshot."""
+    kernel32 = _kernel32
+    if kernel32 is None:
+        return []
 
+    snapshot_handle = kernel32.CreateToolhelp32Snapshot(_WINDOWS_TH32CS_SNAPPROCESS, 0)
+    if not snapshot_handle or snapshot_handle == _WINDOWS_INVALID_HANDLE_VALUE:
+        return []
+
+    children_by_parent: dict[int, list[int]] = {}
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        has_entry = kernel32.Process32FirstW(snapshot_handle, ctypes.byref(entry))
+        while has_entry:
+            child_pid = int(entry.th32ProcessID)
+            parent_pid = int(entry.th32ParentProcessID)
+            if child_pid != parent_pid:
+                children_by_parent.setdefault(parent_pid, []).append(child_pid)
+            has_entry = kernel32.Process32NextW(snapshot_handle, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot_handle)
+
+    descendants: list[int] = []
+    visited = {pid}
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        for child_pid in children_by_parent.get(current, []):
+            if child_pid in visited:
+                continue
+            visited.add(child_pid)
+            descendants.append(child_pid)
+            pending.append(child_pid)
+
+    descendants.reverse()
+    return descendants
+
+
+def _terminate_pid(pid: int) -> int:
+    """Terminate one process; return 0 on success or the Win32 error code."""
+    kernel32 = _kernel32
+    if kernel32 is None:
+        return -1
+
+    ctypes.set_last_error(0)
+    handle = kernel32.OpenProcess(_WINDOWS_PROCESS_TERMINATE, False, pid)
+    if not handle:
+        return ctypes.get_last_error() or -1
+
+    try:
+        if kernel32.TerminateProcess(handle, 1):
+            return 0
+        return ctypes.get_last_error() or -1
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _force_kill_pid_via_taskkill(pid: int) -> tuple[bool, str | None]:
+    """Fallback process tree kill through `taskkill /F /T`."""
     result = _run_command(["taskkill", "/PID", str(pid), "/F", "/T"])
     if result.returncode == 0:
         return True, None
@@ -298,12 +641,88 @@ def _force_kill_pid(pid: int) -> tuple[bool, str | None]:
     return False, output or "taskkill 执行失败"
 
 
-def _wait_for_port_release(host: str, port: int, timeout_seconds: float = 8.0) -> bool:
-    """Wait until host:port is bindable after process termination."""
+def _force_kill_pid(pid: int) -> tuple[bool, str | None]:
+    """Force terminate a Windows process tree by pid."""
+    if sys.platform != "win32":
+        return False, "当前平台暂不支持自动强制关闭占用进程"
+
+    if _kernel32 is None:
+        return _force_kill_pid_via_taskkill(pid)
+
+    for child_pid in _list_descendant_pids(pid):
+        _terminate_pid(child_pid)
+
+    error_code = _terminate_pid(pid)
+    if error_code == 0:
+        return True, None
+
+    message = f"TerminateProcess 执行失败 (错误码 {error_code})"
+    try:
+        detail = ctypes.FormatError(error_code).strip()  # type: ignore[attr-defined]
+    except Exception:
+        detail = ""
+    if detail:
+        message += f": {detail}"
+    return False, message
+
+
+def _open_process_wait_handle(pid: int) -> int | None:
+    """Open a SYNCHRONIZE handle so process exit can be awaited directly."""
+    if _kernel32 is None:
+        return None
+
+    handle = _kernel32.OpenProcess(_WINDOWS_SYNCHRONIZE, False, pid)
+    return int(handle) if handle else None
+
+
+def _close_process_handle(handle: int | None) -> None:
+    """Close a process handle opened by `_open_process_wait_handle`."""
+    if handle is None or _kernel32 is None:
+        return
+
+    try:
+        _kernel32.CloseHandle(handle)
+    except Exception:
+        pass
+
+
+def _wait_for_port_release(
+    host: str,
+    port: int,
+    timeout_seconds: float = 8.0,
+    occupier: PortOccupier | None = None,
+    process_handle: int | None = None,
+) -> bool:
+    """Wait until host:port is bindable after process termination.
+
+    With a process handle, the kernel signals exit directly and only a few
+    short bind probes follow. Otherwise (or if the socket lingers), poll: one
+    listener snapshot per tick covers every address family, and bind probes
+    only run once the killed occupier has left the table.
+    """
+    resolved = _resolve_sockaddrs(host, port)
+    if resolved is None:
+        return True
+
     deadline = time.monotonic() + timeout_seconds
+
+    if process_handle is not None and _kernel32 is not None:
+        wait_result = _kernel32.WaitForSingleObject(
+            process_handle, int(timeout_seconds * 1000)
+        )
+        if wait_result == _WINDOWS_WAIT_OBJECT_0:
+            # Socket teardown may trail process exit by a few tens of ms.
+            for _attempt in range(3):
+                if _try_bind(resolved):
+                    return True
+                time.sleep(0.05)
+
     while time.monotonic() < deadline:
-        if _is_port_bindable(host, port):
-            return True
+        if occupier is None or not _occupier_still_owns_port(
+            occupier, port, _snapshot_tcp_listeners()
+        ):
+            if _try_bind(resolved):
+                return True
         time.sleep(0.2)
     return False
 
@@ -339,7 +758,7 @@ def ensure_startup_port_available(host: str, port: int) -> bool:
         dialog_when_no_console=False,
     )
 
-    occupier = _find_port_occupier(port)
+    occupier = _find_port_occupier(port, _snapshot_tcp_listeners())
     if occupier is None:
         _notify_user(
             "❌ 未能识别占用该端口的进程，无法自动关闭。\n"
@@ -378,7 +797,8 @@ def ensure_startup_port_available(host: str, port: int) -> bool:
         )
         return False
 
-    if not _occupier_still_owns_port(occupier, port):
+    # Take a fresh snapshot: the prompt above may have waited arbitrarily long.
+    if not _occupier_still_owns_port(occupier, port, _snapshot_tcp_listeners()):
         _notify_user(
             "⚠ 占用状态已变化，请重新启动程序后重试。",
             level="warning",
@@ -394,16 +814,24 @@ def ensure_startup_port_available(host: str, port: int) -> bool:
         )
         return False
 
-    killed, error_message = _force_kill_pid(occupier.pid)
-    if not killed:
-        _notify_user(
-            f"❌ 强制关闭失败: {error_message}",
-            level="error",
-            dialog_when_no_console=True,
+    process_handle = _open_process_wait_handle(occupier.pid)
+    try:
+        killed, error_message = _force_kill_pid(occupier.pid)
+        if not killed:
+            _notify_user(
+                f"❌ 强制关闭失败: {error_message}",
+                level="error",
+                dialog_when_no_console=True,
+            )
+            return False
+
+        released = _wait_for_port_release(
+            host, port, occupier=occupier, process_handle=process_handle
         )
-        return False
+    finally:
+        _close_process_handle(process_handle)
 
-    if not _wait_for_port_release(host, port):
+    if not released:
         _notify_user(
             "❌ 进程关闭后端口仍未释放，请稍后重试。",
             level="error",
@@ -5,9 +5,8 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from threading import Lock
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
@@ -15,7 +14,14 @@ from urllib.request import Request, urlopen
 import yaml
 
 from app.core.app_meta import GITHUB_REPOSITORY
-from app.core.config import load_config
+from app.core.config import config_file_signature, load_config
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings unavailable
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 
 _DEFAULT_REMOTE_FILE_PATH = "public-config.yaml"
@@ -45,14 +51,22 @@ class GitHubPublicConfigResult:
     status_code: int | None = None
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class _CacheEntry:
     result: GitHubPublicConfigResult
     fetched_at_epoch: float
+    etag: str | None = None
+    last_modified: str | None = None
 
 
-_CACHE_LOCK = Lock()
+# Entries are immutable and replaced wholesale; single-key dict get/set is
+# atomic under the GIL, so readers and writers need no lock.
 _RESULT_CACHE: dict[str, _CacheEntry] = {}
+# (config file signature, source_url, timeout_seconds, cache_ttl_seconds); the
+# signature is load_config()'s own (mtime_ns, size) key, or None if missing.
+_runtime_options_cache: (
+    tuple[tuple[int, int] | None, str, float, float] | None
+) = None
 
 
 def _default_source_url() -> str:
@@ -65,8 +79,10 @@ def _default_source_url() -> str:
     )
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _now_iso(epoch: float | None = None) -> str:
+    if epoch is None:
+        return datetime.now(timezone.utc).isoformat()
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
 
 
 def _parse_positive_float(value: object, default: float) -> float:
@@ -115,6 +131,20 @@ def _extract_runtime_options(
     return source_url, timeout_seconds, cache_ttl_seconds
 
 
+def _load_runtime_options() -> tuple[str, float, float]:
+    """Resolve runtime options from config.yaml, reusing them until it changes."""
+    global _runtime_options_cache
+
+    signature = config_file_signature()
+    cached = _runtime_options_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2], cached[3]
+
+    options = _extract_runtime_options(load_config())
+    _runtime_options_cache = (signature, *options)
+    return options
+
+
 def _is_http_url(url: str) -> bool:
     lowered = url.lower()
     return lowered.startswith("https://") or lowered.startswith("http://")
@@ -147,7 +177,9 @@ def _stringify_content(value: object) -> str:
         try:
             return json.dumps(value, ensure_ascii=False, indent=2).strip()
         except TypeError:
-            return yaml.safe_dump(value, allow_unicode=True, sort_keys=False).strip()
+            return yaml.dump(
+                value, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False
+            ).strip()
 
     return str(value).strip()
 
@@ -169,6 +201,16 @@ def _coerce_bool(value: object) -> bool:
     return False
 
 
+def _load_payload(text: str) -> Any:
+    # JSON is a YAML subset; json.loads is much cheaper for JSON-shaped files.
+    if text[:1] in ("{", "["):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    return yaml.load(text, Loader=_YamlLoader)
+
+
 def _parse_remote_payload(
     raw_text: str,
 ) -> tuple[bool, str | None, str | None, str | None, str | None, str]:
@@ -177,7 +219,7 @@ def _parse_remote_payload(
         return False, None, None, None, None, "远程配置文件为空"
 
     try:
-        payload = yaml.safe_load(text)
+        payload = _load_payload(text)
     except yaml.YAMLError:
         return False, None, None, None, None, "远程配置格式错误"
 
@@ -238,22 +280,79 @@ def _read_cache(
     if cache_ttl_seconds <= 0:
         return None
 
-    with _CACHE_LOCK:
-        entry = _RESULT_CACHE.get(source_url)
-        if entry is None:
-            return None
-        if (time.time() - entry.fetched_at_epoch) > cache_ttl_seconds:
-            _RESULT_CACHE.pop(source_url, None)
-            return None
-        return entry.result
+    entry = _RESULT_CACHE.get(source_url)
+    if entry is None:
+        return None
+    # Stale entries are kept so their validators can drive a conditional GET.
+    if (time.time() - entry.fetched_at_epoch) > cache_ttl_seconds:
+        return None
+    return entry.result
 
 
-def _store_cache(source_url: str, result: GitHubPublicConfigResult) -> None:
-    with _CACHE_LOCK:
-        _RESULT_CACHE[source_url] = _CacheEntry(
-            result=result,
-            fetched_at_epoch=time.time(),
-        )
+def _get_cache_entry(source_url: str) -> _CacheEntry | None:
+    return _RESULT_CACHE.get(source_url)
+
+
+def _store_cache(
+    source_url: str,
+    result: GitHubPublicConfigResult,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    fetched_at_epoch: float | None = None,
+) -> None:
+    _RESULT_CACHE[source_url] = _CacheEntry(
+        result=result,
+        fetched_at_epoch=(
+            time.time() if fetched_at_epoch is None else fetched_at_epoch
+        ),
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def _touch_cache(source_url: str) -> GitHubPublicConfigResult | None:
+    entry = _RESULT_CACHE.get(source_url)
+    if entry is None:
+        return None
+    _RESULT_CACHE[source_url] = replace(entry, fetched_at_epoch=time.time())
+    return entry.result
+
+
+def _build_conditional_headers(entry: _CacheEntry | None) -> dict[str, str]:
+    if entry is None:
+        return {}
+
+    headers: dict[str, str] = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def _get_header_value(headers: Any, key: str) -> str | None:
+    if headers is None:
+        return None
+    value = headers.get(key)
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _read_bounded_body(response: Any) -> memoryview | None:
+    """Read response into a fixed buffer; None as soon as it exceeds the cap."""
+    buffer = bytearray(_MAX_RESPONSE_BYTES + 1)
+    view = memoryview(buffer)
+    size = 0
+    while True:
+        chunk_size = response.readinto(view[size:])
+        if not chunk_size:
+            return view[:size]
+        size += chunk_size
+        if size > _MAX_RESPONSE_BYTES:
+            return None
 
 
 def fetch_github_public_config_sync(
@@ -262,10 +361,11 @@ def fetch_github_public_config_sync(
     force_refresh: bool = False,
 ) -> GitHubPublicConfigResult:
     """Fetch GitHub-hosted public config for CLI/WebUI display."""
-    runtime_cfg = cfg if cfg is not None else load_config()
-    source_url, timeout_seconds, cache_ttl_seconds = _extract_runtime_options(
-        runtime_cfg
-    )
+    if cfg is not None:
+        options = _extract_runtime_options(cfg)
+    else:
+        options = _load_runtime_options()
+    source_url, timeout_seconds, cache_ttl_seconds = options
 
     if not _is_http_url(source_url):
         return _build_failure(
@@ -277,13 +377,22 @@ def fetch_github_public_config_sync(
         if cached is not None:
             return cached
 
-    request = Request(source_url, headers=_REQUEST_HEADERS)
+    cached_entry = _get_cache_entry(source_url)
+    request_headers = dict(_REQUEST_HEADERS)
+    request_headers.update(_build_conditional_headers(cached_entry))
+    request = Request(source_url, headers=request_headers)
 
     try:
         with urlopen(request, timeout=timeout_seconds) as response:
             status_code = int(response.getcode())
-            body = response.read(_MAX_RESPONSE_BYTES + 1)
+            body = _read_bounded_body(response)
+            etag = _get_header_value(response.headers, "ETag")
+            last_modified = _get_header_value(response.headers, "Last-Modified")
     except HTTPError as exc:
+        if exc.code == 304:
+            not_modified = _touch_cache(source_url)
+            if not_modified is not None:
+                return not_modified
         return _build_failure(
             source_url,
             "获取远程配置失败",
@@ -312,14 +421,15 @@ def fetch_github_public_config_sync(
             status_code=0,
         )
 
-    if len(body) > _MAX_RESPONSE_BYTES:
+    if body is None:
         return _build_failure(source_url, "远程配置文件过大", status_code=200)
 
-    raw_text = body.decode("utf-8", errors="replace")
+    raw_text = str(body, "utf-8", errors="replace")
     visible, title, content, link_url, link_text, message = _parse_remote_payload(
         raw_text
     )
 
+    fetched_at_epoch = time.time()
     result = GitHubPublicConfigResult(
         success=True,
         visible=visible,
@@ -327,12 +437,18 @@ def fetch_github_public_config_sync(
         title=title,
         content=content,
         message=message,
-        fetched_at=_now_iso(),
+        fetched_at=_now_iso(fetched_at_epoch),
         link_url=link_url,
         link_text=link_text,
         status_code=status_code,
     )
-    _store_cache(source_url, result)
+    _store_cache(
+        source_url,
+        result,
+        etag=etag,
+        last_modified=last_modified,
+        fetched_at_epoch=fetched_at_epoch,
+    )
     return result
 
 
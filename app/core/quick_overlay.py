@@ -9,17 +9,23 @@ This module provides:
 from __future__ import annotations
 
 import ctypes
+import ctypes.wintypes as wintypes
+import functools
 import json
+import os
 import queue
+import re
 import threading
 import time
-from typing import Any
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import tkinter as tk
 from tkinter import ttk
 
-from app.core.config import PRESETS_DIR, load_config
+from app.core.config import PRESETS_DIR, config_file_signature, load_config
 from app.core.desktop_shell import (
     is_quick_panel_window_visible,
     open_or_focus_quick_panel_window,
@@ -30,15 +36,33 @@ from app.core.overlay_status import register_overlay_status_handler
 from app.core.sender import sender
 
 user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
 
 VK_SHIFT = 0x10
 VK_CONTROL = 0x11
 VK_MENU = 0x12
+VK_LSHIFT = 0xA0
+VK_RSHIFT = 0xA1
+VK_LCONTROL = 0xA2
+VK_RCONTROL = 0xA3
+VK_LMENU = 0xA4
+VK_RMENU = 0xA5
 VK_LWIN = 0x5B
 VK_RWIN = 0x5C
 VK_XBUTTON1 = 0x05
 VK_XBUTTON2 = 0x06
 
+WH_KEYBOARD_LL = 13
+HC_ACTION = 0
+
+WM_QUIT = 0x0012
+WM_USER = 0x0400
+WM_KEYDOWN = 0x0100
+WM_KEYUP = 0x0101
+WM_SYSKEYDOWN = 0x0104
+WM_SYSKEYUP = 0x0105
+PM_NOREMOVE = 0x0000
+
 GWL_EXSTYLE = -20
 WS_EX_TOOLWINDOW = 0x00000080
 WS_EX_NOACTIVATE = 0x08000000
@@ -55,6 +79,20 @@ SW_SHOWNOACTIVATE = 4
 
 DEFAULT_HOTKEY = "f7"
 
+_TRIGGER_EVENT = "<<QuickOverlayTrigger>>"
+_STATUS_EVENT = "<<QuickOverlayStatus>>"
+_PRESETS_EVENT = "<<QuickOverlayPresets>>"
+_HOOK_READY_TIMEOUT_SECONDS = 1.0
+_STATUS_BACKLOG_LIMIT = 256
+_POLL_ACTIVE_INTERVAL_SECONDS = 0.005
+# Trigger source bits for edge detection in the hook and polling paths.
+_TRIGGER_HOTKEY_BIT = 1 << 0
+_TRIGGER_MOUSE_BIT = 1 << 1
+
+# Single-pass status classification; IGNORECASE replaces text.lower().
+_STATUS_ERROR_PATTERN = re.compile(r"失败|异常|取消|error", re.IGNORECASE)
+_STATUS_SUCCESS_PATTERN = re.compile(r"完成|成功")
+
 _SPECIAL_KEYS: dict[str, int] = {
     "space": 0x20,
     "enter": 0x0D,
@@ -84,54 +122,155 @@ _MODIFIER_KEYS: dict[str, int] = {
     "super": VK_LWIN,
 }
 
+# Low-level hooks report sided modifier VKs; hotkeys are parsed as generic ones.
+_GENERIC_MODIFIER_VKS: dict[int, int] = {
+    VK_LSHIFT: VK_SHIFT,
+    VK_RSHIFT: VK_SHIFT,
+    VK_LCONTROL: VK_CONTROL,
+    VK_RCONTROL: VK_CONTROL,
+    VK_LMENU: VK_MENU,
+    VK_RMENU: VK_MENU,
+}
+_SIDED_MODIFIER_MASKS: dict[int, int] = {
+    VK_SHIFT: (1 << VK_LSHIFT) | (1 << VK_RSHIFT),
+    VK_CONTROL: (1 << VK_LCONTROL) | (1 << VK_RCONTROL),
+    VK_MENU: (1 << VK_LMENU) | (1 << VK_RMENU),
+}
+
+_LRESULT = ctypes.c_ssize_t
+_HOOKPROC = ctypes.WINFUNCTYPE(_LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+
+class _KBDLLHOOKSTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("vkCode", wintypes.DWORD),
+        ("scanCode", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),
+    ]
+
+
+user32.SetWindowsHookExW.argtypes = (
+    ctypes.c_int,
+    _HOOKPROC,
+    wintypes.HINSTANCE,
+    wintypes.DWORD,
+)
+user32.SetWindowsHookExW.restype = wintypes.HHOOK
+user32.CallNextHookEx.argtypes = (
+    wintypes.HHOOK,
+    ctypes.c_int,
+    wintypes.WPARAM,
+    wintypes.LPARAM,
+)
+user32.CallNextHookEx.restype = _LRESULT
+user32.UnhookWindowsHookEx.argtypes = (wintypes.HHOOK,)
+user32.UnhookWindowsHookEx.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = (
+    ctypes.POINTER(wintypes.MSG),
+    wintypes.HWND,
+    wintypes.UINT,
+    wintypes.UINT,
+)
+user32.GetMessageW.restype = wintypes.BOOL
+user32.PeekMessageW.argtypes = (
+    ctypes.POINTER(wintypes.MSG),
+    wintypes.HWND,
+    wintypes.UINT,
+    wintypes.UINT,
+    wintypes.UINT,
+)
+user32.PeekMessageW.restype = wintypes.BOOL
+user32.PostThreadMessageW.argtypes = (
+    wintypes.DWORD,
+    wintypes.UINT,
+    wintypes.WPARAM,
+    wintypes.LPARAM,
+)
+user32.PostThreadMessageW.restype = wintypes.BOOL
+user32.GetAsyncKeyState.argtypes = (ctypes.c_int,)
+user32.GetAsyncKeyState.restype = ctypes.c_short
+user32.GetForegroundWindow.argtypes = ()
+user32.GetForegroundWindow.restype = wintypes.HWND
+user32.IsWindow.argtypes = (wintypes.HWND,)
+user32.IsWindow.restype = wintypes.BOOL
+user32.SetForegroundWindow.argtypes = (wintypes.HWND,)
+user32.SetForegroundWindow.restype = wintypes.BOOL
+user32.GetWindowLongW.argtypes = (wintypes.HWND, ctypes.c_int)
+user32.GetWindowLongW.restype = wintypes.LONG
+user32.SetWindowLongW.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.LONG)
+user32.SetWindowLongW.restype = wintypes.LONG
+user32.SetWindowPos.argtypes = (
+    wintypes.HWND,
+    wintypes.HWND,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    wintypes.UINT,
+)
+user32.SetWindowPos.restype = wintypes.BOOL
+user32.ShowWindow.argtypes = (wintypes.HWND, ctypes.c_int)
+user32.ShowWindow.restype = wintypes.BOOL
+kernel32.GetCurrentThreadId.argtypes = ()
+kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+kernel32.GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+
+_get_async_key_state = user32.GetAsyncKeyState
+
 
 def _is_vk_pressed(vk: int) -> bool:
-    return bool(user32.GetAsyncKeyState(vk) & 0x8000)
+    # restype is c_short, so the "currently down" high bit reads as negative.
+    return _get_async_key_state(vk) < 0
 
 
-def _parse_key_token(token: str) -> int | None:
-    lowered = token.strip().lower()
-    if not lowered:
-        return None
+def _build_token_table() -> dict[str, int]:
+    table = dict(_SPECIAL_KEYS)
+    for idx in range(1, 25):
+        table[f"f{idx}"] = 0x6F + idx
+    for code in range(ord("A"), ord("Z") + 1):
+        table[chr(code).lower()] = code
+    for code in range(ord("0"), ord("9") + 1):
+        table[chr(code)] = code
+    table.update(_MODIFIER_KEYS)
+    return table
 
-    if lowered in _SPECIAL_KEYS:
-        return _SPECIAL_KEYS[lowered]
 
-    if lowered.startswith("f") and lowered[1:].isdigit():
-        idx = int(lowered[1:])
-        if 1 <= idx <= 24:
-            return 0x6F + idx
+_TOKEN_TO_VK: dict[str, int] = _build_token_table()
 
-    if len(lowered) == 1:
-        upper = lowered.upper()
-        if ("A" <= upper <= "Z") or ("0" <= upper <= "9"):
-            return ord(upper)
+# section name -> (config_file_signature(), section dict); dicts are read-only.
+_config_section_cache: dict[
+    str, tuple[tuple[int, int] | None, dict[str, Any]]
+] = {}
 
-    return None
+
+def _parse_key_token(token: str) -> int | None:
+    return _TOKEN_TO_VK.get(token.strip().lower())
 
 
-def _parse_hotkey(hotkey: str) -> list[int]:
+@functools.lru_cache(maxsize=64)
+def _parse_hotkey(hotkey: str) -> tuple[int, ...]:
     if not hotkey:
-        return []
+        return ()
 
     keys: list[int] = []
-    seen: set[int] = set()
-
     for raw_token in hotkey.split("+"):
-        token = raw_token.strip().lower()
-        if not token:
+        vk = _parse_key_token(raw_token)
+        if vk is None or vk in keys:
             continue
+        keys.append(vk)
 
-        vk = _MODIFIER_KEYS.get(token)
-        if vk is None:
-            vk = _parse_key_token(token)
-        if vk is None or vk in seen:
-            continue
+    return tuple(keys)
 
-        seen.add(vk)
-        keys.append(vk)
 
-    return keys
+def _vk_mask(vks: tuple[int, ...]) -> int:
+    mask = 0
+    for vk in vks:
+        mask |= 1 << vk
+    return mask
 
 
 def _parse_mouse_side_button(button: str | None) -> int | None:
@@ -146,22 +285,95 @@ def _parse_mouse_side_button(button: str | None) -> int | None:
     return None
 
 
-def _preset_lines(preset: dict[str, Any]) -> list[str]:
-    lines: list[str] = []
+def _preset_lines(preset: dict[str, Any]) -> tuple[str, ...]:
     raw_texts = preset.get("texts", [])
     if not isinstance(raw_texts, list):
-        return lines
+        return ()
 
+    lines: list[str] = []
+    append = lines.append
     for item in raw_texts:
-        if not isinstance(item, dict):
+        # Parsed JSON objects are always exact dicts.
+        if type(item) is not dict:
             continue
-        line_type = "do" if item.get("type") == "do" else "me"
-        content = str(item.get("content", "")).strip()
-        if not content:
+        content = item.get("content", "")
+        content = content.strip() if type(content) is str else str(content).strip()
+        if content:
+            append(("/do " if item.get("type") == "do" else "/me ") + content)
+
+    return tuple(lines)
+
+
+def _coalesce_status_updates(
+    updates: list[tuple[str, bool]],
+) -> list[tuple[str, bool]]:
+    """Collapse a burst of status updates to the ones that stay visible.
+
+    Only the newest final update (which starts the hide timer) and a newer
+    in-progress update after it can still be seen once the burst is painted.
+    """
+    for idx in range(len(updates) - 1, -1, -1):
+        if not updates[idx][1]:
             continue
-        lines.append(f"/{line_type} {content}")
+        coalesced = [updates[idx]]
+        if idx < len(updates) - 1:
+            coalesced.append(updates[-1])
+        return coalesced
+    return updates[-1:]
+
+
+def _get_cached_config_section(section: str) -> dict[str, Any]:
+    """Return one config.yaml section, re-read only when the file changes."""
+    # Same (mtime_ns, size) key as load_config()'s own cache.
+    signature = config_file_signature()
+    cached = _config_section_cache.get(section)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    section_cfg = load_config().get(section, {})
+    if not isinstance(section_cfg, dict):
+        section_cfg = {}
+    _config_section_cache[section] = (signature, section_cfg)
+    return section_cfg
+
+
+def _read_preset_file(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+    except (OSError, ValueError):
+        # ValueError covers JSONDecodeError and bad UTF-8.
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    preset_id = str(data.get("id", "")).strip()
+    name = str(data.get("name", "")).strip()
+    if not preset_id or not name:
+        return None
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedPreset:
+    mtime_ns: int
+    size: int
+    preset: dict[str, Any] | None  # None when the file is invalid
+    lines: tuple[str, ...] = ()
+    rows: tuple[str, ...] = ()  # numbered listbox rows for ``lines``
+    label: str = ""
+
 
-    return lines
+def _parse_cached_preset(path: str, mtime_ns: int, size: int) -> _CachedPreset:
+    preset = _read_preset_file(path)
+    if preset is None:
+        return _CachedPreset(mtime_ns, size, None)
+
+    lines = _preset_lines(preset)
+    rows = tuple(f"{idx:02d}  {line}" for idx, line in enumerate(lines, start=1))
+    label = f"{preset.get('name', '')} ({len(lines)}条)"
+    return _CachedPreset(mtime_ns, size, preset, lines, rows, label)
 
 
 class QuickOverlayModule:
@@ -182,6 +394,7 @@ class QuickOverlayModule:
         if not self._hotkey_vks:
             self._hotkey_label = DEFAULT_HOTKEY
             self._hotkey_vks = _parse_hotkey(DEFAULT_HOTKEY)
+        self._hotkey_mask = _vk_mask(self._hotkey_vks)
 
         self._mouse_button_label = str(
             overlay_cfg.get("mouse_side_button", "") or ""
@@ -199,10 +412,32 @@ class QuickOverlayModule:
 
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
-        self._status_queue: queue.Queue[tuple[str, bool]] = queue.Queue()
+        self._send_lock = threading.Lock()
+        self._send_job_active = False
+        self._send_worker: threading.Thread | None = None
+        self._send_jobs: queue.SimpleQueue[Callable[[], None] | None] = (
+            queue.SimpleQueue()
+        )
+        self._status_lock = threading.Lock()
+        self._status_wakeup_pending = False
+        self._status_updates: deque[tuple[str, bool]] = deque(
+            maxlen=_STATUS_BACKLOG_LIMIT
+        )
 
-        self._hotkey_active_last = False
-        self._mouse_active_last = False
+        # Held trigger sources as _TRIGGER_*_BIT flags; edges are new bits.
+        self._trigger_state = 0
+
+        self._hook_thread: threading.Thread | None = None
+        self._hook_thread_id = 0
+        self._hook_ready = threading.Event()
+        self._hooks_installed = False
+        self._hook_procs: list[Any] = []
+        # Bit N set means VK N is currently held, as seen by the keyboard hook.
+        self._pressed_mask = 0
+        self._dispatch_thread: threading.Thread | None = None
+        self._watch_thread: threading.Thread | None = None
+        # Tk virtual event names for the dispatcher thread; None stops it.
+        self._ui_events: queue.SimpleQueue[str | None] = queue.SimpleQueue()
 
         self._root: tk.Tk | None = None
         self._popup: tk.Toplevel | None = None
@@ -216,11 +451,27 @@ class QuickOverlayModule:
         self._status_body_frame: tk.Frame | None = None
 
         self._presets: list[dict[str, Any]] = []
+        self._preset_cache: dict[str, _CachedPreset] = {}
+        self._preset_snapshot: list[_CachedPreset] | None = None
+        # Only one background load runs at a time; it hands its result to the
+        # Tk thread through _pending_presets and a <<QuickOverlayPresets>> event.
+        self._preset_load_pending = False
+        self._pending_presets: list[_CachedPreset] | None = None
+        self._preset_options: tuple[str, ...] = ()
         self._preset_ids: list[str] = []
+        self._preset_entries_by_id: dict[str, _CachedPreset] = {}
+        self._preset_index: dict[str, int] = {}
         self._current_preset_id: str | None = None
-        self._current_lines: list[str] = []
+        self._current_lines: tuple[str, ...] = ()
 
         self._status_hide_job: str | None = None
+        self._status_geometry: tuple[int, int, int, int] | None = None
+        self._status_styled = False
+        self._status_shown: tuple[str, bool] | None = None
+        self._status_dirty: tuple[str, bool] | None = None
+        self._status_paint_scheduled = False
+        self._status_visual: tuple[str, str, str, str] | None = None
+        self._status_label_style: tuple[str, int] | None = None
         self._last_foreground_hwnd = 0
         self._last_preload_attempt_monotonic = 0.0
         self._preload_retry_interval_seconds = 1.2
@@ -230,6 +481,9 @@ class QuickOverlayModule:
 
         self._web_base_url = str(web_base_url or "").strip()
         self._desktop_token = str(desktop_token or "").strip()
+        # (server config section it was built from, URL); the section object
+        # is only replaced when config.yaml changes.
+        self._quick_panel_url_cache: tuple[object, str | None] | None = None
 
         self._popup_bg = "#0a1222"
         self._surface_bg = "#111c33"
@@ -258,6 +512,10 @@ class QuickOverlayModule:
             self._bg_opacity = 0.92
             font_delta = 0
 
+        self._screen_width = 0
+        self._screen_height = 0
+        # ((screen width, screen height), "+x+y") for the centered popup.
+        self._popup_position: tuple[tuple[int, int], str] | None = None
         self._popup_width = 460 if self._compact_mode else 560
         self._popup_height = 420 if self._compact_mode else 500
         self._frame_padx = 12 if self._compact_mode else 16
@@ -297,6 +555,11 @@ class QuickOverlayModule:
     def stop(self) -> None:
         self._stop_event.set()
         register_overlay_status_handler(None)
+        self._stop_trigger_threads()
+        if self._send_worker is not None:
+            # Let an in-flight send finish; the worker exits after it.
+            self._send_jobs.put(None)
+            self._send_worker = None
 
         root = self._root
         if root is not None:
@@ -336,16 +599,25 @@ class QuickOverlayModule:
             self._root = tk.Tk()
             self._root.withdraw()
             self._configure_ttk_styles()
-
-            self._build_popup_window()
-            self._build_status_window()
-            self._refresh_presets()
-
-            self._root.after(self._poll_interval_ms, self._poll_triggers)
-            self._root.after(80, self._drain_status_updates)
+            self._refresh_screen_size()
+            # The popup and status windows are built on first use; most
+            # sessions never open them.
+
+            self._root.bind(_TRIGGER_EVENT, lambda _e: self._show_popup())
+            self._root.bind(_STATUS_EVENT, lambda _e: self._drain_status_updates())
+            self._root.bind(_PRESETS_EVENT, lambda _e: self._on_presets_loaded())
+            self._start_trigger_threads()
+            self._root.after(
+                int(self._preload_retry_interval_seconds * 1000),
+                self._preload_tick,
+            )
+            # Flush anything queued before the dispatcher could wake us.
+            self._root.after_idle(self._drain_status_updates)
             self._root.mainloop()
         except Exception as exc:
             print(f"⚠ 快捷悬浮窗模块运行失败: {exc}")
+        finally:
+            self._stop_trigger_threads()
 
     def _configure_ttk_styles(self) -> None:
         if self._root is None:
@@ -395,7 +667,7 @@ class QuickOverlayModule:
 
         popup = tk.Toplevel(self._root)
         popup.title("VanceSender 快速发送")
-        popup.geometry(f"{self._popup_width}x{self._popup_height}")
+        popup.wm_geometry(f"{self._popup_width}x{self._popup_height}")
         popup.resizable(False, False)
         popup.configure(bg=self._popup_bg)
         popup.attributes("-topmost", True)
@@ -478,7 +750,7 @@ class QuickOverlayModule:
         refresh_btn = tk.Button(
             preset_inner,
             text="刷新",
-            command=self._refresh_presets,
+            command=self._refresh_presets_async,
             bg=self._card_bg,
             fg=self._text_main,
             activebackground="#21345a",
@@ -646,8 +918,177 @@ class QuickOverlayModule:
         self._status_tag_label = status_tag_label
         self._status_text_label = label
         self._status_body_frame = body
+        self._apply_status_ex_style()
+
+    def _start_trigger_threads(self) -> None:
+        """Start hook-based trigger detection, or the polling watcher."""
+        # Side buttons are always polled: a mouse hook or raw input would run
+        # Python on every mouse move, far more often than the poll interval.
+        poll_hotkey = not self._start_input_hooks()
+        if poll_hotkey or self._mouse_side_vkey is not None:
+            watch_thread = threading.Thread(
+                target=self._hotkey_watch_loop,
+                args=(poll_hotkey,),
+                name="quick-overlay-poll",
+                daemon=True,
+            )
+            watch_thread.start()
+            self._watch_thread = watch_thread
+
+        dispatch_thread = threading.Thread(
+            target=self._run_ui_dispatch,
+            name="quick-overlay-dispatch",
+            daemon=True,
+        )
+        dispatch_thread.start()
+        self._dispatch_thread = dispatch_thread
+
+    def _start_input_hooks(self) -> bool:
+        """Install the keyboard hook; return False to fall back to polling."""
+        self._hook_ready.clear()
+        self._hooks_installed = False
+        hook_thread = threading.Thread(
+            target=self._run_input_hooks,
+            name="quick-overlay-hooks",
+            daemon=True,
+        )
+        hook_thread.start()
+        self._hook_thread = hook_thread
+
+        if (
+            not self._hook_ready.wait(_HOOK_READY_TIMEOUT_SECONDS)
+            or not self._hooks_installed
+        ):
+            self._stop_input_hooks()
+            return False
+        return True
+
+    def _stop_input_hooks(self) -> None:
+        hook_thread_id = self._hook_thread_id
+        if hook_thread_id:
+            user32.PostThreadMessageW(hook_thread_id, WM_QUIT, 0, 0)
+
+        hook_thread = self._hook_thread
+        if hook_thread is not None and hook_thread is not threading.current_thread():
+            hook_thread.join(timeout=1.0)
+        self._hook_thread = None
+
+    def _stop_trigger_threads(self) -> None:
+        self._stop_input_hooks()
+        if self._dispatch_thread is not None:
+            self._ui_events.put(None)
+
+        for thread in (self._watch_thread, self._dispatch_thread):
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+        self._watch_thread = None
+        self._dispatch_thread = None
+
+    def _run_input_hooks(self) -> None:
+        """Own the keyboard hook and pump messages so Windows can deliver it."""
+        msg = wintypes.MSG()
+        # Force creation of this thread's message queue before publishing its id.
+        user32.PeekMessageW(ctypes.byref(msg), None, WM_USER, WM_USER, PM_NOREMOVE)
+        self._hook_thread_id = int(kernel32.GetCurrentThreadId())
+
+        module_handle = kernel32.GetModuleHandleW(None)
+        keyboard_proc = _HOOKPROC(self._on_keyboard_hook)
+        self._hook_procs = [keyboard_proc]
+        hook = user32.SetWindowsHookExW(
+            WH_KEYBOARD_LL, keyboard_proc, module_handle, 0
+        )
 
-    def _poll_triggers(self) -> None:
+        try:
+            self._hooks_installed = bool(hook)
+            self._hook_ready.set()
+            if not self._hooks_installed:
+                return
+
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                pass
+        finally:
+            if hook:
+                user32.UnhookWindowsHookEx(hook)
+            self._hook_thread_id = 0
+            self._hook_procs = []
+            self._pressed_mask = 0
+
+    def _on_keyboard_hook(self, n_code: int, w_param: int, l_param: int) -> int:
+        if n_code == HC_ACTION:
+            info = ctypes.cast(l_param, ctypes.POINTER(_KBDLLHOOKSTRUCT)).contents
+            if w_param in (WM_KEYDOWN, WM_SYSKEYDOWN):
+                self._update_pressed_vk(int(info.vkCode), pressed=True)
+            elif w_param in (WM_KEYUP, WM_SYSKEYUP):
+                self._update_pressed_vk(int(info.vkCode), pressed=False)
+        return user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+    def _update_pressed_vk(self, vk: int, pressed: bool) -> None:
+        pressed_mask = self._pressed_mask
+        generic_vk = _GENERIC_MODIFIER_VKS.get(vk)
+        if pressed:
+            pressed_mask |= 1 << vk
+            if generic_vk is not None:
+                pressed_mask |= 1 << generic_vk
+        else:
+            pressed_mask &= ~(1 << vk)
+            if (
+                generic_vk is not None
+                and not pressed_mask & _SIDED_MODIFIER_MASKS[generic_vk]
+            ):
+                pressed_mask &= ~(1 << generic_vk)
+        self._pressed_mask = pressed_mask
+
+        hotkey_mask = self._hotkey_mask
+        hotkey_active = bool(hotkey_mask) and (
+            pressed_mask & hotkey_mask
+        ) == hotkey_mask
+        previous = self._trigger_state
+        if hotkey_active and not previous & _TRIGGER_HOTKEY_BIT:
+            hotkey_active = self._confirm_hotkey_held(generic_vk or vk)
+        if hotkey_active:
+            state = previous | _TRIGGER_HOTKEY_BIT
+        else:
+            state = previous & ~_TRIGGER_HOTKEY_BIT
+        self._trigger_state = state
+        if state & ~previous:
+            self._ui_events.put(_TRIGGER_EVENT)
+
+    def _confirm_hotkey_held(self, current_vk: int) -> bool:
+        """Drop keys whose release the hook missed (e.g. secure desktop)."""
+        for hotkey_vk in self._hotkey_vks:
+            if hotkey_vk == current_vk:
+                continue
+            if not _is_vk_pressed(hotkey_vk):
+                self._pressed_mask &= ~(
+                    (1 << hotkey_vk) | _SIDED_MODIFIER_MASKS.get(hotkey_vk, 0)
+                )
+                return False
+        return True
+
+    def _run_ui_dispatch(self) -> None:
+        # Hook callbacks and sender workers must not block on Tcl, so all
+        # cross-thread wakeups are turned into Tk virtual events here.
+        while True:
+            event_name = self._ui_events.get()
+            if event_name is None or self._stop_event.is_set():
+                return
+
+            root = self._root
+            if root is None:
+                continue
+            try:
+                root.event_generate(event_name, when="tail")
+            except (tk.TclError, RuntimeError):
+                if event_name == _STATUS_EVENT:
+                    # Let the next status retry the wakeup instead of stalling.
+                    with self._status_lock:
+                        self._status_wakeup_pending = False
+                elif event_name == _PRESETS_EVENT:
+                    # Drop this load so the next popup show starts a new one.
+                    self._pending_presets = None
+                    self._preset_load_pending = False
+
+    def _preload_tick(self) -> None:
         if self._root is None:
             return
 
@@ -656,39 +1097,63 @@ class QuickOverlayModule:
             return
 
         self._preload_web_quick_panel_if_needed()
-
-        hotkey_active = bool(self._hotkey_vks) and all(
-            _is_vk_pressed(vk) for vk in self._hotkey_vks
+        self._root.after(
+            int(self._preload_retry_interval_seconds * 1000),
+            self._preload_tick,
         )
-        if hotkey_active and not self._hotkey_active_last:
-            self._show_popup()
-        self._hotkey_active_last = hotkey_active
 
-        mouse_active = False
-        if self._mouse_side_vkey is not None:
-            mouse_active = _is_vk_pressed(self._mouse_side_vkey)
-            if mouse_active and not self._mouse_active_last:
-                self._show_popup()
-        self._mouse_active_last = mouse_active
-
-        self._root.after(self._poll_interval_ms, self._poll_triggers)
+    def _hotkey_watch_loop(self, poll_hotkey: bool = True) -> None:
+        """Poll trigger keys off the Tk thread.
+
+        With the keyboard hook installed only the mouse side button is polled.
+        """
+        # Hoist everything the loop touches into locals; it runs up to 200x/s.
+        get_async_key_state = _get_async_key_state
+        # Waiting on the stop event lets stop() end the loop mid-interval.
+        wait_for_stop = self._stop_event.wait
+        post_trigger = self._ui_events.put
+        idle_seconds = self._poll_interval_ms / 1000.0
+        active_seconds = _POLL_ACTIVE_INTERVAL_SECONDS
+        mouse_vk = self._mouse_side_vkey
+        # The last token is the combo's main key (e.g. F7 in ctrl+f7); it is
+        # checked first so an idle tick costs one GetAsyncKeyState call.
+        hotkey_vks = self._hotkey_vks if poll_hotkey else ()
+        trigger_vk = hotkey_vks[-1] if hotkey_vks else None
+        modifier_vks = hotkey_vks[:-1]
+        trigger_state = 0
+
+        interval = 0.0
+        while not wait_for_stop(interval):
+            state = 0
+            any_held = False
+            if trigger_vk is not None and get_async_key_state(trigger_vk) < 0:
+                any_held = True
+                if all(get_async_key_state(vk) < 0 for vk in modifier_vks):
+                    state |= _TRIGGER_HOTKEY_BIT
+            if mouse_vk is not None and get_async_key_state(mouse_vk) < 0:
+                any_held = True
+                state |= _TRIGGER_MOUSE_BIT
+
+            # One wakeup per tick even if several sources went down at once.
+            if state & ~trigger_state:
+                post_trigger(_TRIGGER_EVENT)
+            trigger_state = state
+
+            # Poll fast while the trigger is held so edges are picked up
+            # promptly; otherwise back off to the configured rate.
+            interval = active_seconds if any_held else idle_seconds
 
     def _drain_status_updates(self) -> None:
         if self._root is None:
             return
 
-        while True:
-            try:
-                text, final = self._status_queue.get_nowait()
-            except queue.Empty:
-                break
-            self._show_status(text, final=final)
-
-        if self._stop_event.is_set():
-            self._root.quit()
-            return
+        with self._status_lock:
+            pending = list(self._status_updates)
+            self._status_updates.clear()
+            self._status_wakeup_pending = False
 
-        self._root.after(80, self._drain_status_updates)
+        for text, final in _coalesce_status_updates(pending):
+            self._show_status(text, final=final)
 
     def _remember_foreground_window(self) -> None:
         self._last_foreground_hwnd = int(user32.GetForegroundWindow() or 0)
@@ -699,17 +1164,26 @@ class QuickOverlayModule:
         if hwnd and user32.IsWindow(hwnd):
             user32.SetForegroundWindow(hwnd)
 
+    def _refresh_screen_size(self) -> None:
+        if self._root is None:
+            return
+        self._screen_width = self._root.winfo_screenwidth()
+        self._screen_height = self._root.winfo_screenheight()
+
     def _center_popup(self) -> None:
         if self._popup is None:
             return
-        self._popup.update_idletasks()
-        w = self._popup.winfo_width()
-        h = self._popup.winfo_height()
-        sw = self._popup.winfo_screenwidth()
-        sh = self._popup.winfo_screenheight()
-        x = max(0, (sw - w) // 2)
-        y = max(0, (sh - h) // 2)
-        self._popup.geometry(f"{w}x{h}+{x}+{y}")
+        # Games may switch resolution while the app runs; re-reading the
+        # screen size is one cheap call per show.
+        self._refresh_screen_size()
+        # The popup is fixed-size, so only its position is set, and the
+        # position string is rebuilt only when the screen size changes.
+        screen_size = (self._screen_width, self._screen_height)
+        if self._popup_position is None or self._popup_position[0] != screen_size:
+            x = max(0, (self._screen_width - self._popup_width) // 2)
+            y = max(0, (self._screen_height - self._popup_height) // 2)
+            self._popup_position = (screen_size, f"+{x}+{y}")
+        self._popup.wm_geometry(self._popup_position[1])
 
     def _append_query_params(self, url: str, params: dict[str, str]) -> str:
         parsed = urlsplit(url)
@@ -734,10 +1208,22 @@ class QuickOverlayModule:
         )
 
     def _resolve_web_quick_panel_url(self) -> str | None:
+        # Called by every trigger and preload tick; the base URL and token are
+        # fixed for the session, so only a server config change rebuilds it.
         base_url = self._web_base_url
-        if not base_url:
-            cfg = load_config()
-            server_cfg = cfg.get("server", {})
+        server_cfg = None if base_url else _get_cached_config_section("server")
+        cached = self._quick_panel_url_cache
+        if cached is not None and cached[0] is server_cfg:
+            return cached[1]
+
+        quick_panel_url = self._build_web_quick_panel_url(base_url, server_cfg)
+        self._quick_panel_url_cache = (server_cfg, quick_panel_url)
+        return quick_panel_url
+
+    def _build_web_quick_panel_url(
+        self, base_url: str, server_cfg: dict[str, Any] | None
+    ) -> str | None:
+        if server_cfg is not None:
             host = str(server_cfg.get("host", "127.0.0.1") or "127.0.0.1").strip()
             try:
                 port = int(server_cfg.get("port", 8730))
@@ -812,15 +1298,23 @@ class QuickOverlayModule:
         if self._show_web_quick_panel():
             return
 
-        if self._popup is None:
+        first_show = self._popup is None
+        if first_show:
+            self._build_popup_window()
+        popup = self._popup
+        if popup is None:
             return
+        if first_show:
+            self._refresh_presets()
 
-        self._refresh_presets()
         self._center_popup()
-        self._popup.deiconify()
-        self._popup.lift()
-        self._popup.attributes("-topmost", True)
-        self._popup.focus_force()
+        popup.deiconify()
+        popup.lift()
+        popup.attributes("-topmost", True)
+        popup.focus_force()
+        # Show last-known presets now; disk changes are applied when loaded.
+        if not first_show:
+            self._refresh_presets_async()
 
     def _hide_popup(self, restore_focus: bool) -> None:
         if self._popup is not None:
@@ -828,48 +1322,117 @@ class QuickOverlayModule:
         if restore_focus:
             self._restore_foreground_window()
 
-    def _load_presets_from_disk(self) -> list[dict[str, Any]]:
+    def _load_presets_from_disk(self) -> list[_CachedPreset]:
+        """Return valid presets ordered by file name, reusing unchanged parses."""
         PRESETS_DIR.mkdir(parents=True, exist_ok=True)
-        loaded: list[dict[str, Any]] = []
-        for fp in sorted(PRESETS_DIR.glob("*.json"), key=lambda p: p.name.lower()):
-            try:
-                with open(fp, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                continue
-
-            if not isinstance(data, dict):
-                continue
-            preset_id = str(data.get("id", "")).strip()
-            name = str(data.get("name", "")).strip()
-            if not preset_id or not name:
-                continue
-            loaded.append(data)
-        return loaded
+        cache = self._preset_cache
+        seen_paths: set[str] = set()
+        loaded: list[tuple[str, _CachedPreset]] = []
+
+        with os.scandir(PRESETS_DIR) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(".json"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                seen_paths.add(entry.path)
+                cached = cache.get(entry.path)
+                if (
+                    cached is None
+                    or cached.mtime_ns != stat.st_mtime_ns
+                    or cached.size != stat.st_size
+                ):
+                    cached = _parse_cached_preset(
+                        entry.path, stat.st_mtime_ns, stat.st_size
+                    )
+                    cache[entry.path] = cached
+
+                if cached.preset is not None:
+                    loaded.append((entry.name.lower(), cached))
+
+        for stale_path in cache.keys() - seen_paths:
+            del cache[stale_path]
+
+        loaded.sort(key=lambda item: item[0])
+        return [cached for _, cached in loaded]
 
     def _refresh_presets(self) -> None:
+        """Load presets synchronously; only used when the popup is built."""
+        self._apply_presets(self._load_presets_from_disk())
+
+    def _refresh_presets_async(self) -> None:
+        if self._preset_load_pending:
+            return
+        self._preset_load_pending = True
+        threading.Thread(
+            target=self._load_presets_in_background,
+            name="quick-overlay-presets",
+            daemon=True,
+        ).start()
+
+    def _load_presets_in_background(self) -> None:
+        try:
+            self._pending_presets = self._load_presets_from_disk()
+        except Exception:
+            self._pending_presets = None
+        finally:
+            # Always wake the Tk thread so _preset_load_pending is cleared.
+            self._ui_events.put(_PRESETS_EVENT)
+
+    def _on_presets_loaded(self) -> None:
+        loaded = self._pending_presets
+        self._pending_presets = None
+        self._preset_load_pending = False
+        if loaded is not None:
+            self._apply_presets(loaded)
+
+    def _apply_presets(self, loaded: list[_CachedPreset]) -> None:
         if self._preset_combo is None or self._line_listbox is None:
             return
 
         current_id = self._current_preset_id
-        self._presets = self._load_presets_from_disk()
-        self._preset_ids = [str(p.get("id", "")) for p in self._presets]
+        # Changed files get fresh cache entries, so identical entry objects
+        # mean the combobox and line list already show this exact state.
+        # Leave the selection alone: this runs after the popup is shown and
+        # the user may already be navigating the lines.
+        previous = self._preset_snapshot
+        if (
+            previous is not None
+            and len(loaded) == len(previous)
+            and all(cached is prior for cached, prior in zip(loaded, previous))
+        ):
+            return
+        self._preset_snapshot = loaded
 
-        options = [
-            f"{p.get('name', '')} ({len(_preset_lines(p))}条)" for p in self._presets
+        self._presets = [
+            cached.preset for cached in loaded if cached.preset is not None
         ]
-        self._preset_combo["values"] = options
+        self._preset_ids = [str(p.get("id", "")) for p in self._presets]
+        # Duplicate ids resolve to the first preset, as the linear scan did.
+        self._preset_entries_by_id = {}
+        self._preset_index = {}
+        for idx, (preset_id, cached) in enumerate(zip(self._preset_ids, loaded)):
+            self._preset_entries_by_id.setdefault(preset_id, cached)
+            self._preset_index.setdefault(preset_id, idx)
+
+        # A tuple is handed to Tcl as a list without an extra copy.
+        options = tuple(cached.label for cached in loaded)
+        if options != self._preset_options:
+            self._preset_combo["values"] = options
+            self._preset_options = options
 
         if not self._presets:
             self._current_preset_id = None
-            self._line_listbox.delete(0, tk.END)
-            self._line_listbox.insert(tk.END, "暂无预设")
-            self._current_lines = []
+            self._replace_listbox_rows(("暂无预设",))
+            self._current_lines = ()
             return
 
-        next_idx = 0
-        if current_id and current_id in self._preset_ids:
-            next_idx = self._preset_ids.index(current_id)
+        next_idx = self._preset_index.get(current_id, 0) if current_id else 0
 
         self._preset_combo.current(next_idx)
         self._current_preset_id = self._preset_ids[next_idx]
@@ -888,37 +1451,43 @@ class QuickOverlayModule:
         if self._line_listbox is None:
             return
 
-        self._line_listbox.delete(0, tk.END)
-        selected = next(
-            (
-                p
-                for p in self._presets
-                if str(p.get("id", "")) == self._current_preset_id
-            ),
-            None,
+        selected = (
+            self._preset_entries_by_id.get(self._current_preset_id)
+            if self._current_preset_id is not None
+            else None
         )
 
         if selected is None:
-            self._current_lines = []
-            self._line_listbox.insert(tk.END, "预设不存在")
+            self._current_lines = ()
+            self._replace_listbox_rows(("预设不存在",))
             return
 
-        lines = _preset_lines(selected)
-        self._current_lines = lines
-        if not lines:
-            self._line_listbox.insert(tk.END, "该预设暂无可发送文本")
+        self._current_lines = selected.lines
+        if not selected.lines:
+            self._replace_listbox_rows(("该预设暂无可发送文本",))
             return
 
-        for idx, line in enumerate(lines, start=1):
-            self._line_listbox.insert(tk.END, f"{idx:02d}  {line}")
+        self._replace_listbox_rows(selected.rows)
+        self._select_first_line()
 
+    def _select_first_line(self) -> None:
+        if self._line_listbox is None:
+            return
         self._line_listbox.selection_clear(0, tk.END)
         self._line_listbox.selection_set(0)
         self._line_listbox.activate(0)
 
+    def _replace_listbox_rows(self, rows: tuple[str, ...]) -> None:
+        listbox = self._line_listbox
+        if listbox is None:
+            return
+        if listbox.size():
+            listbox.delete(0, tk.END)
+        # One variadic insert is a single Tcl call regardless of row count.
+        listbox.insert(tk.END, *rows)
+
     def _sender_options(self) -> dict[str, Any]:
-        cfg = load_config()
-        sender_cfg = cfg.get("sender", {})
+        sender_cfg = _get_cached_config_section("sender")
         return {
             "method": sender_cfg.get("method", "clipboard"),
             "chat_open_key": sender_cfg.get("chat_open_key", "t"),
@@ -950,13 +1519,10 @@ class QuickOverlayModule:
         text = self._current_lines[idx]
         self._hide_popup(restore_focus=True)
         self._enqueue_status("快捷面板单条发送中...", final=False)
-
-        worker = threading.Thread(
-            target=self._run_single_send,
-            args=(text,),
-            daemon=True,
+        self._submit_send_job(
+            lambda: self._run_single_send(text),
+            busy_message="已有发送任务进行中",
         )
-        worker.start()
 
     def _send_all_lines(self) -> None:
         if not self._current_lines:
@@ -966,13 +1532,43 @@ class QuickOverlayModule:
         texts = list(self._current_lines)
         self._hide_popup(restore_focus=True)
         self._enqueue_status(f"快捷面板批量发送开始，共 {len(texts)} 条", final=False)
-
-        worker = threading.Thread(
-            target=self._run_batch_send,
-            args=(texts,),
-            daemon=True,
+        self._submit_send_job(
+            lambda: self._run_batch_send(texts),
+            busy_message="已有批量发送任务进行中",
         )
-        worker.start()
+
+    def _submit_send_job(self, job: Callable[[], None], busy_message: str) -> None:
+        # One job at a time: a second request while a send is still running
+        # is rejected, as the sender guards did, rather than queued behind it.
+        with self._send_lock:
+            if self._send_job_active:
+                self._enqueue_status(busy_message, final=True)
+                return
+            self._send_job_active = True
+
+            worker = self._send_worker
+            if worker is None or not worker.is_alive():
+                worker = threading.Thread(
+                    target=self._run_send_worker,
+                    name="quick-overlay-send",
+                    daemon=True,
+                )
+                worker.start()
+                self._send_worker = worker
+        self._send_jobs.put(job)
+
+    def _run_send_worker(self) -> None:
+        while True:
+            job = self._send_jobs.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as exc:
+                self._enqueue_status(f"快捷面板发送异常: {exc}", final=True)
+            finally:
+                with self._send_lock:
+                    self._send_job_active = False
 
     def _run_single_send(self, text: str) -> None:
         if sender.is_sending:
@@ -1043,47 +1639,66 @@ class QuickOverlayModule:
             self._enqueue_status(f"快捷面板发送失败: {error}", final=True)
 
     def _enqueue_status(self, text: str, final: bool) -> None:
-        self._status_queue.put((text, final))
+        with self._status_lock:
+            self._status_updates.append((text, final))
+            if self._status_wakeup_pending:
+                return
+            self._status_wakeup_pending = True
+        self._ui_events.put(_STATUS_EVENT)
 
     def notify_status(self, text: str, final: bool) -> None:
         """Public status entry for non-overlay callers (e.g. WebUI routes)."""
         self._enqueue_status(text, final)
 
     def _status_visual_state(self, text: str, final: bool) -> tuple[str, str, str, str]:
-        lowered = text.lower()
-        is_error = any(key in text for key in ("失败", "异常", "取消")) or (
-            "error" in lowered
-        )
-        is_success = final and ("完成" in text or ("成功" in text and not is_error))
-
-        if is_error:
+        if _STATUS_ERROR_PATTERN.search(text):
             return ("失败", self._danger_color, "#4a1d2b", "#ffd6de")
-        if is_success:
+        if final and _STATUS_SUCCESS_PATTERN.search(text):
             return ("完成", self._success_color, "#163c2b", "#dcffe9")
         return ("进行中", self._accent_primary, "#1b2f4d", self._text_main)
 
     def _show_status(self, text: str, final: bool) -> None:
-        if (
-            self._root is None
-            or self._status_window is None
-            or self._status_var is None
-        ):
+        if self._root is None:
             return
 
+        # Defer to one idle-time paint so several updates within a single
+        # event-loop turn cost one restyle/geometry pass.
+        self._status_dirty = (text, final)
+        if self._status_paint_scheduled:
+            return
+        self._status_paint_scheduled = True
+        self._root.after_idle(self._paint_status)
+
+    def _paint_status(self) -> None:
+        self._status_paint_scheduled = False
+        dirty = self._status_dirty
+        self._status_dirty = None
+        if dirty is None or self._root is None:
+            return
+        if self._status_window is None:
+            self._build_status_window()
+        if self._status_window is None or self._status_var is None:
+            return
+        text, final = dirty
+
+        # A repeated in-progress message is already on screen with no hide
+        # timer pending, so there is nothing to redraw.
+        if not final and self._status_shown == (text, final):
+            return
+        self._status_shown = (text, final)
+
         if self._status_hide_job is not None:
             self._root.after_cancel(self._status_hide_job)
             self._status_hide_job = None
 
-        self._status_var.set(text)
+        width, height = self._status_window_size(text)
+        self._apply_status_text(text, final, width)
+        self._apply_status_window_geometry(width, height)
 
-        tag_text, tag_fg, tag_bg, message_fg = self._status_visual_state(text, final)
-        if self._status_tag_label is not None:
-            self._status_tag_label.configure(text=tag_text, fg=tag_fg, bg=tag_bg)
-        if self._status_text_label is not None:
-            self._status_text_label.configure(fg=message_fg)
-        if self._status_body_frame is not None:
-            self._status_body_frame.configure(highlightbackground=tag_fg)
+        if final:
+            self._status_hide_job = self._root.after(3000, self._hide_status)
 
+    def _status_window_size(self, text: str) -> tuple[int, int]:
         chars = max(0, len(text))
         width = min(
             self._status_max_width,
@@ -1097,47 +1712,104 @@ class QuickOverlayModule:
             self._status_max_height,
             self._status_base_height + (lines - 1) * self._status_line_step,
         )
-
-        if self._status_text_label is not None:
+        return width, height
+
+    def _apply_status_text(self, text: str, final: bool, width: int) -> None:
+        if self._status_var is not None:
+            self._status_var.set(text)
+
+        # Progress bursts usually stay in one visual state (e.g. "进行中"),
+        # so only the StringVar changes; restyle widgets on transitions only.
+        visual_state = self._status_visual_state(text, final)
+        tag_text, tag_fg, tag_bg, message_fg = visual_state
+        if visual_state != self._status_visual:
+            self._status_visual = visual_state
+            if self._status_tag_label is not None:
+                self._status_tag_label.configure(text=tag_text, fg=tag_fg, bg=tag_bg)
+            if self._status_body_frame is not None:
+                self._status_body_frame.configure(highlightbackground=tag_fg)
+
+        label_style = (
+            message_fg,
+            max(self._status_min_width - 20, width - self._status_wrap_margin),
+        )
+        if (
+            self._status_text_label is not None
+            and label_style != self._status_label_style
+        ):
+            self._status_label_style = label_style
             self._status_text_label.configure(
-                wraplength=max(
-                    self._status_min_width - 20, width - self._status_wrap_margin
-                )
+                fg=label_style[0], wraplength=label_style[1]
             )
 
-        screen_width = self._status_window.winfo_screenwidth()
-        x = max(0, screen_width - width - 16)
+    def _apply_status_window_geometry(self, width: int, height: int) -> None:
+        status_window = self._status_window
+        if status_window is None:
+            return
+
+        self._refresh_screen_size()
+        x = max(0, self._screen_width - width - 16)
         y = 16
-        self._status_window.geometry(f"{width}x{height}+{x}+{y}")
-        self._status_window.deiconify()
-        self._status_window.lift()
+        geometry = (x, y, width, height)
+        geometry_changed = geometry != self._status_geometry
+        withdrawn = status_window.state() == "withdrawn"
+        if not withdrawn and not geometry_changed:
+            return
 
+        if geometry_changed:
+            self._status_geometry = geometry
+            status_window.geometry(f"{width}x{height}+{x}+{y}")
+        status_window.deiconify()
+        status_window.lift()
+        # The ex-style is set once, but topmost/no-activate must be re-asserted
+        # on every deiconify or a fullscreen game can cover or lose focus to it.
         self._enforce_status_no_activate()
 
-        if final:
-            self._status_hide_job = self._root.after(3000, self._hide_status)
-
     def _hide_status(self) -> None:
         if self._status_window is not None:
             self._status_window.withdraw()
         self._status_hide_job = None
+        self._status_shown = None
 
-    def _enforce_status_no_activate(self) -> None:
+    def _status_window_hwnd(self) -> int:
         if self._status_window is None:
-            return
+            return 0
+        try:
+            return int(self._status_window.winfo_id())
+        except tk.TclError:
+            return 0
+
+    def _apply_status_ex_style(self) -> bool:
+        """Mark the status window tool/no-activate; runs once per window."""
+        if self._status_styled:
+            return True
 
-        hwnd = int(self._status_window.winfo_id())
+        hwnd = self._status_window_hwnd()
         if not hwnd:
-            return
+            return False
 
         ex_style = int(user32.GetWindowLongW(hwnd, GWL_EXSTYLE))
         desired_style = ex_style | WS_EX_TOOLWINDOW | WS_EX_NOACTIVATE
         if desired_style != ex_style:
             user32.SetWindowLongW(hwnd, GWL_EXSTYLE, desired_style)
+            user32.SetWindowPos(
+                hwnd,
+                None,
+                0,
+                0,
+                0,
+                0,
+                SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE | SWP_FRAMECHANGED,
+            )
+        self._status_styled = True
+        return True
 
-        flags = (
-            SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE | SWP_FRAMECHANGED | SWP_SHOWWINDOW
-        )
+    def _enforce_status_no_activate(self) -> None:
+        if not self._apply_status_ex_style():
+            return
+
+        hwnd = self._status_window_hwnd()
+        flags = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE | SWP_SHOWWINDOW
         user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, flags)
         user32.ShowWindow(hwnd, SW_SHOWNOACTIVATE)
 
@@ -10,6 +10,7 @@ import json
 import os
 import tempfile
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,8 @@ _lock = threading.Lock()
 _stats: dict[str, Any] | None = None
 _dirty_count = 0
 _FLUSH_EVERY = 10  # Write to disk every N operations
+_SECONDS_PER_DAY = 86400
+_today_key: tuple[int, str] = (-1, "")  # (UTC day number, "YYYY-MM-DD")
 
 
 def _ensure_dir() -> None:
@@ -57,6 +60,19 @@ def _empty_stats() -> dict[str, Any]:
     }
 
 
+def _utc_today() -> str:
+    """Return today's UTC date key, reformatted only when the day changes.
+
+    Caller must hold ``_lock``.
+    """
+    global _today_key
+    day = int(time.time()) // _SECONDS_PER_DAY
+    if day != _today_key[0]:
+        date = datetime.fromtimestamp(day * _SECONDS_PER_DAY, timezone.utc)
+        _today_key = (day, date.strftime("%Y-%m-%d"))
+    return _today_key[1]
+
+
 def _save() -> None:
     """Write stats to disk atomically."""
     if _stats is None:
@@ -91,7 +107,7 @@ def record_send(success: bool, preset_name: str | None = None) -> None:
             stats["total_failed"] += 1
 
         # Daily count
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        today = _utc_today()
         dc = stats.setdefault("daily_counts", {})
         dc[today] = dc.get(today, 0) + 1
 
@@ -121,26 +137,32 @@ def record_batch() -> None:
 
 def get_stats() -> dict[str, Any]:
     """Return a summary of send statistics."""
+    # Only copy under the lock; sorting and building the summary happen after
+    # release so record_send() on the sender thread is not held up.
     with _lock:
         stats = _load()
-        # Build most-used presets top 5
-        pu = stats.get("preset_usage", {})
-        top_presets = sorted(pu.items(), key=lambda x: x[1], reverse=True)[:5]
-        most_used = [{"name": name, "count": count} for name, count in top_presets]
-
-        return {
-            "total_sent": stats.get("total_sent", 0),
-            "total_success": stats.get("total_success", 0),
-            "total_failed": stats.get("total_failed", 0),
-            "total_batches": stats.get("total_batches", 0),
-            "success_rate": (
-                round(stats["total_success"] / stats["total_sent"] * 100, 1)
-                if stats.get("total_sent", 0) > 0
-                else 0
-            ),
-            "most_used_presets": most_used,
-            "daily_counts": stats.get("daily_counts", {}),
-        }
+        total_sent = stats.get("total_sent", 0)
+        total_success = stats.get("total_success", 0)
+        total_failed = stats.get("total_failed", 0)
+        total_batches = stats.get("total_batches", 0)
+        preset_usage = list(stats.get("preset_usage", {}).items())
+        daily_counts = dict(stats.get("daily_counts", {}))
+
+    # Build most-used presets top 5
+    top_presets = sorted(preset_usage, key=lambda x: x[1], reverse=True)[:5]
+    most_used = [{"name": name, "count": count} for name, count in top_presets]
+
+    return {
+        "total_sent": total_sent,
+        "total_success": total_success,
+        "total_failed": total_failed,
+        "total_batches": total_batches,
+        "success_rate": (
+            round(total_success / total_sent * 100, 1) if total_sent > 0 else 0
+        ),
+        "most_used_presets": most_used,
+        "daily_counts": daily_counts,
+    }
 
 
 def reset_stats() -> None:
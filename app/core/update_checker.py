@@ -129,13 +129,14 @@ def _compare_versions(
     return _VersionCompareResult(update_available=False, comparable=False)
 
 
-def _safe_json_loads(raw_text: str) -> Any:
-    if not raw_text:
+def _safe_json_loads(raw_body: bytes) -> Any:
+    if not raw_body:
         return {}
     try:
-        return json.loads(raw_text)
-    except json.JSONDecodeError:
-        return raw_text
+        # json decodes UTF-8 bytes itself, so no intermediate str is built.
+        return json.loads(raw_body)
+    except ValueError:  # JSONDecodeError or invalid UTF-8
+        return raw_body.decode("utf-8", errors="replace")
 
 
 def _extract_api_message(payload: Any) -> str:
@@ -286,7 +287,7 @@ def _fetch_json(
     try:
         with urlopen(request, timeout=_REQUEST_TIMEOUT) as response:
             status_code = int(response.getcode())
-            body = response.read().decode("utf-8", errors="replace")
+            body = response.read()
             headers = {key.lower(): value for key, value in response.headers.items()}
             return _GitHubResponse(
                 status_code=status_code,
@@ -294,7 +295,7 @@ def _fetch_json(
                 headers=headers,
             )
     except HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
+        body = exc.read()
         headers = (
             {key.lower(): value for key, value in exc.headers.items()}
             if exc.headers is not None